@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -77,9 +78,72 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open between requests instead of reconnecting each time
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock when a transaction starts, so writers queue on
+            # busy_timeout instead of failing with "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    # Read-only connection for views; with WAL it never waits on the scraper
+    'readonly': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': f"file:{(BASE_DIR / 'db.sqlite3').as_posix()}?mode=ro",
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'uri': True,
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
+}
+
+# Database alias the public views read from
+READ_DATABASE = 'readonly'
+
+# Applied to every new SQLite connection by bjs_website.sqlite. The WAL
+# journal is set by the WSGI application (and so runserver) and scrape_news
+# instead, since it is stored in db.sqlite3 itself
+SQLITE_PRAGMAS = {
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -20000,  # in KiB, so ~20 MB
+    'busy_timeout': 5000,  # ms
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Shared between the web server and the scraper, which invalidates the news
+# page through it, so it must not be the per-process local-memory backend
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'django_cache',
     }
 }
 
+# Cache alias and lifetime (seconds) of the rendered news page
+NEWS_CACHE_ALIAS = 'default'
+NEWS_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Whole-page cache of the home, contact, gallery and team pages. Keys include
+# the template's mtime (and the responsive image manifest's, on pages that use
+# it) and DEPLOY_VERSION; set the latter (e.g. to the release's git hash) on
+# every deploy so asset changes show up too.
+PAGE_CACHE_ALIAS = 'default'
+PAGE_CACHE_TIMEOUT = 24 * 60 * 60
+DEPLOY_VERSION = os.environ.get('DEPLOY_VERSION', 'dev')
+
+# Keep gzip/brotli copies of cached pages so responses are never compressed
+# on the fly (pages carrying a CSRF token are stored uncompressed)
+COMPRESS_CACHED_PAGES = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -119,6 +183,32 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     BASE_DIR / "website" / "static",
 ]
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Outside DEBUG, collectstatic writes content-hashed copies (styles.4f3a9c0b1d2e.css)
+# plus a manifest that {% static %} resolves names through, so browsers can cache
+# the files forever. Run collectstatic on every deploy.
+STATIC_MANIFEST = not DEBUG
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'website.storage.ManifestStorage'
+            if STATIC_MANIFEST else
+            'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+
+# Sizes and formats of the responsive image variants written by optimize_media,
+# read by the {% responsive_image %} template tag
+RESPONSIVE_IMAGES_MANIFEST = BASE_DIR / 'website' / 'responsive_images.json'
+
+# Cache lifetime of content-hashed static files: they never change, only get replaced
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
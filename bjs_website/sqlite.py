@@ -0,0 +1,45 @@
+"""SQLite tuning applied to every new database connection.
+
+The pragmas trade a little durability on power loss (``synchronous=NORMAL``
+is still safe in WAL mode) for far fewer fsyncs. WAL itself, which lets the
+news views keep reading while the scraper holds a write transaction, is
+stored in the database file rather than per connection, so it is switched on
+by ``enable_wal`` where the server and the scraper start instead of here;
+other commands (tests, makemigrations) leave db.sqlite3 as it is.
+"""
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Pragmas that need write access to the database file
+WRITE_PRAGMAS = ('synchronous',)
+
+
+def is_read_only(connection):
+    return 'mode=ro' in str(connection.settings_dict['NAME'])
+
+
+def enable_wal(using=DEFAULT_DB_ALIAS):
+    """Switch the database file to WAL; returns the journal mode in effect
+
+    SQLite keeps the previous mode inside a transaction or for an in-memory
+    database, so this is a no-op under the test runner.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return None
+    with connection.cursor() as cursor:
+        return cursor.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    read_only = is_read_only(connection)
+    with connection.cursor() as cursor:
+        for pragma, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            if read_only and pragma in WRITE_PRAGMAS:
+                continue
+            cursor.execute(f'PRAGMA {pragma}={value}')
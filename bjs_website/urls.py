@@ -14,10 +14,16 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
+
+from website.compression import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('website.urls')),
+    # Static files with their precompressed .br/.gz copies, for deployments
+    # without a front-end server (runserver serves them itself when DEBUG)
+    re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), serve_static),
 ]
@@ -10,9 +10,17 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.db import connections
+
+from bjs_website.sqlite import enable_wal
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bjs_website.settings')
 
 application = get_wsgi_application()
 
+# Readers must not wait on the scraper's writes (runserver loads this too)
+enable_wal()
+# Workers forked from this process open their own connections
+connections.close_all()
+
 # just a comment
\ No newline at end of file
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class WebsiteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'website'
+
+    def ready(self):
+        # Registers the connection_created hook that tunes SQLite
+        import bjs_website.sqlite  # noqa: F401
+        from . import signals  # noqa: F401
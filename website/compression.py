@@ -0,0 +1,122 @@
+"""Serve gzip/brotli-compressed bytes that were compressed ahead of time.
+
+Static files get ``.gz``/``.br`` siblings from ``manage.py compress_static``
+and rendered pages keep compressed copies next to the HTML in the page
+caches, so a response only has to pick the variant the client accepts.
+Brotli is used when the ``brotli`` package is installed.
+"""
+import gzip
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views import static
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# File suffix per Content-Encoding, most preferred first
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+
+# ManifestStaticFilesStorage names: styles.4f3a9c0b1d2e.css
+HASHED_NAME = re.compile(r'^(?P<stem>.+)\.[0-9a-f]{12}(?P<suffix>\.[^./]+)?$')
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.html', '.txt', '.json', '.xml', '.map', '.ico'}
+
+
+def available_encodings():
+    return [encoding for encoding in ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def accepted_encodings(request):
+    """Encodings the client accepts with a non-zero quality"""
+    accepted = set()
+    for item in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        try:
+            quality = float(params.strip()[2:]) if params.strip().startswith('q=') else 1.0
+        except ValueError:
+            continue
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def compressed_variants(content):
+    """``content`` plus each smaller compressed form of it, keyed by encoding"""
+    variants = {'identity': content}
+    if settings.COMPRESS_CACHED_PAGES:
+        for encoding in available_encodings():
+            compressed = compress(content, encoding)
+            if len(compressed) < len(content):
+                variants[encoding] = compressed
+    return variants
+
+
+def variant_response(request, variants):
+    """HTML response using the best variant the client accepts"""
+    accepted = accepted_encodings(request)
+    encoding = next((encoding for encoding in ENCODINGS if encoding in variants and encoding in accepted), None)
+    response = HttpResponse(variants[encoding or 'identity'])
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def find_static(path):
+    """Collected file if there is one, otherwise the app's source file"""
+    if settings.STATIC_ROOT:
+        try:
+            absolute = safe_join(settings.STATIC_ROOT, path)
+        except ValueError:
+            return None
+        if os.path.isfile(absolute):
+            return absolute
+    return finders.find(path)
+
+
+def is_hashed(path):
+    """Whether ``path`` is the current content-hashed name of a manifest entry"""
+    match = HASHED_NAME.match(path)
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', None)
+    return bool(match and hashed_files and hashed_files.get(match['stem'] + (match['suffix'] or '')) == path)
+
+
+def serve_static(request, path):
+    """Serve a static file, or its precompressed sibling if the client accepts one"""
+    path = posixpath.normpath(path).lstrip('/')
+    absolute = find_static(path)
+    if not absolute:
+        raise Http404(f'"{path}" could not be found')
+
+    siblings = [encoding for encoding, suffix in ENCODINGS.items() if os.path.isfile(absolute + suffix)]
+    accepted = accepted_encodings(request)
+    encoding = next((encoding for encoding in siblings if encoding in accepted), None)
+    if encoding:
+        absolute += ENCODINGS[encoding]
+    directory, name = os.path.split(absolute)
+    # static.serve takes Content-Type and Content-Encoding from the .gz/.br name
+    response = static.serve(request, name, document_root=directory)
+    if siblings:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    if is_hashed(path):
+        # A changed file gets a new name, so this one can be cached for good
+        patch_cache_control(response, public=True, max_age=settings.STATIC_IMMUTABLE_MAX_AGE, immutable=True)
+    return response
@@ -0,0 +1,80 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from website.management.commands.scrape_news import Command as ScrapeCommand
+from website.scraping.classifier import KeywordClassifier
+
+
+def substring_classify(text, categories, default):
+    """The scan ``categorize_article`` used to do, for comparison"""
+    text = text.lower()
+    for category, keywords in categories:
+        if sum(1 for keyword in keywords if keyword in text):
+            return category
+    return default
+
+
+class Command(BaseCommand):
+    help = 'Time the keyword classifier against the old substring scan as the keyword list grows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--headlines',
+            type=int,
+            default=5000,
+            help='Number of synthetic headlines to classify',
+        )
+        parser.add_argument(
+            '--extra-keywords',
+            type=int,
+            nargs='+',
+            default=[0, 500, 2000],
+            help='Synthetic keywords to add on top of the real ones, one run per value',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for the synthetic headlines',
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        filler = (
+            'government said the minister groups plans new results report market '
+            'company rand country city launch price week deal court years first'
+        ).split()
+        keywords = ScrapeCommand.POWER_SOLAR_KEYWORDS + ScrapeCommand.ICT_KEYWORDS
+        texts = [
+            ' '.join(rng.choice(keywords) if rng.random() < 0.1 else rng.choice(filler)
+                     for _ in range(rng.randint(8, 40)))
+            for _ in range(options['headlines'])
+        ]
+
+        self.stdout.write(f'{len(texts)} synthetic headlines')
+        for extra in options['extra_keywords']:
+            synthetic = [f'keyword{n}' for n in range(extra)]
+            categories = [
+                ('solar', ScrapeCommand.POWER_SOLAR_KEYWORDS + synthetic[::2]),
+                ('ict', ScrapeCommand.ICT_KEYWORDS + synthetic[1::2]),
+            ]
+
+            started = time.perf_counter()
+            classifier = KeywordClassifier(categories, default='ict')
+            compile_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            classifier.classify_many(texts)
+            table_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for text in texts:
+                substring_classify(text, categories, 'ict')
+            substring_ms = (time.perf_counter() - started) * 1000
+
+            self.stdout.write(
+                f'{classifier.keyword_count:5d} keywords: compile {compile_ms:7.2f} ms, '
+                f'phrase table {table_ms:8.2f} ms, substring scan {substring_ms:8.2f} ms'
+            )
@@ -0,0 +1,74 @@
+from io import StringIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from website.management.commands.scrape_news import Command as ScrapeCommand
+from website.scraping.fetch import fetch_sources
+from website.scraping.replay import FixtureArchive, ReplayPool
+from website.scraping.sources import SOURCES
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the news scraper offline against a recorded fixture archive'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'archive',
+            help='Fixture directory written by "scrape_news --record DIR"',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Number of full scrape runs to time',
+        )
+        parser.add_argument(
+            '--max-articles',
+            type=int,
+            default=10,
+            help='Maximum number of articles to scrape per source',
+        )
+
+    def handle(self, *args, **options):
+        archive = FixtureArchive(options['archive'])
+        recorded = set(archive.urls()) if archive.path.is_dir() else set()
+        sources = [source for source in SOURCES.values() if source.url in recorded]
+        if not sources:
+            raise CommandError(f'No recorded listing pages in {archive.path}')
+
+        iterations = options['iterations']
+        totals = {source.key: {'fetch_ms': 0.0, 'parse_ms': 0.0, 'db_ms': 0.0, 'articles': 0} for source in sources}
+
+        for _ in range(iterations):
+            scraper = ScrapeCommand(stdout=StringIO(), stderr=StringIO())
+            scraper.conditional_cache = None
+            with ReplayPool(archive) as pool, transaction.atomic():
+                scraper.session_pool = pool
+                results = fetch_sources(sources, pool)
+                for source in sources:
+                    scraper.process_source(source, options['max_articles'], results[source.key])
+                    stats = scraper.source_stats[source.key]
+                    total = totals[source.key]
+                    total['fetch_ms'] += stats.fetch_ms
+                    total['parse_ms'] += stats.parse_ms
+                    total['db_ms'] += stats.db_ms
+                    total['articles'] += stats.articles_seen
+                # Leave the database as we found it
+                transaction.set_rollback(True)
+
+        self.stdout.write(f'{iterations} iterations over {len(sources)} recorded sources\n')
+        self.stdout.write(
+            f'{"Source":<14}{"pages/s":>10}{"articles/s":>12}{"fetch ms":>10}{"parse ms":>10}{"DB ms":>10}'
+        )
+        for source in sources:
+            total = totals[source.key]
+            elapsed = (total['fetch_ms'] + total['parse_ms'] + total['db_ms']) / 1000
+            pages_per_sec = iterations / elapsed if elapsed else 0.0
+            articles_per_sec = total['articles'] / elapsed if elapsed else 0.0
+            self.stdout.write(
+                f'{source.name:<14}{pages_per_sec:>10.1f}{articles_per_sec:>12.1f}'
+                f'{total["fetch_ms"] / iterations:>10.2f}'
+                f'{total["parse_ms"] / iterations:>10.2f}'
+                f'{total["db_ms"] / iterations:>10.2f}'
+            )
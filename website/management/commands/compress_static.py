@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from website.compression import COMPRESSIBLE_EXTENSIONS, ENCODINGS, available_encodings, compress
+
+
+def static_dirs():
+    """Collected files if collectstatic has run, otherwise the app's sources"""
+    if settings.STATIC_ROOT and Path(settings.STATIC_ROOT).is_dir():
+        return [Path(settings.STATIC_ROOT)]
+    return [Path(directory) for directory in settings.STATICFILES_DIRS]
+
+
+class Command(BaseCommand):
+    help = 'Write .gz (and .br, with the brotli package) copies of the static files next to them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'directories',
+            nargs='*',
+            help='Directories to compress (default: STATIC_ROOT, or STATICFILES_DIRS without one)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompress files whose compressed copies are already up to date',
+        )
+
+    def handle(self, *args, **options):
+        directories = [Path(directory) for directory in options['directories']] or static_dirs()
+        encodings = available_encodings()
+        if 'br' not in encodings:
+            self.stdout.write(self.style.WARNING('brotli is not installed, writing .gz files only'))
+
+        written = skipped = 0
+        for directory in directories:
+            for path in sorted(directory.rglob('*')):
+                if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE_EXTENSIONS:
+                    continue
+                for encoding in encodings:
+                    if self.compress_file(path, encoding, options['force']):
+                        written += 1
+                    else:
+                        skipped += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} compressed files, {skipped} up to date or not smaller'))
+
+    def compress_file(self, path, encoding, force):
+        target = path.with_name(path.name + ENCODINGS[encoding])
+        mtime = path.stat().st_mtime
+        if not force and target.exists() and target.stat().st_mtime == mtime:
+            return False
+
+        data = path.read_bytes()
+        compressed = compress(data, encoding)
+        if len(compressed) >= len(data):
+            # Not worth a Content-Encoding; drop any stale copy
+            target.unlink(missing_ok=True)
+            return False
+        target.write_bytes(compressed)
+        # Same mtime as the source marks the copy as current and keeps
+        # Last-Modified identical whichever variant is served
+        os.utime(target, (mtime, mtime))
+        return True
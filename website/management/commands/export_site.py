@@ -0,0 +1,119 @@
+import re
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from website import urls
+from website.utils import write_atomic
+
+DEFAULT_OUTPUT = settings.BASE_DIR / 'export'
+
+# Same as collectstatic's default --ignore patterns
+STATIC_IGNORE = ['CVS', '.*', '*~']
+
+
+def page_names():
+    """Named HTML pages of the site, in urls.py order (not the JSON API or metrics)"""
+    return [pattern.name for pattern in urls.pages if isinstance(pattern, URLPattern) and pattern.name]
+
+
+def default_host():
+    """First concrete ALLOWED_HOSTS entry, or localhost (allowed when DEBUG is on)"""
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*':
+            return host.lstrip('.')
+    return 'localhost'
+
+
+class Command(BaseCommand):
+    help = 'Pre-render the site into a directory of static files any web server can serve'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=str(DEFAULT_OUTPUT),
+            help='Directory to write the site into (default: export/)',
+        )
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            metavar='URL_NAME',
+            help='Re-export just these pages, e.g. "--only news" after a scrape; static files are left alone',
+        )
+        parser.add_argument(
+            '--static-url',
+            help='Rewrite references to STATIC_URL to this prefix, e.g. a CDN',
+        )
+        parser.add_argument(
+            '--host',
+            default=default_host(),
+            help='Host name to render the pages as (default: the first of ALLOWED_HOSTS)',
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options['output'])
+        names = page_names()
+        if options['only']:
+            unknown = set(options['only']) - set(names)
+            if unknown:
+                raise CommandError(
+                    f'Not an HTML page: {", ".join(sorted(unknown))} (choose from {", ".join(names)})'
+                )
+            names = [name for name in names if name in options['only']]
+
+        static_url = '/' + settings.STATIC_URL.lstrip('/')
+        self.static_pattern = re.compile(r'''(["'(])''' + re.escape(static_url))
+        self.new_static_url = options['static_url']
+
+        client = Client(SERVER_NAME=options['host'])
+        for name in names:
+            self.export_page(client, reverse(name), output)
+
+        if not options['only']:
+            copied = self.copy_static(output / static_url.strip('/'))
+            self.stdout.write(f'Copied {copied} static files')
+
+    def export_page(self, client, url, output):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f'{url} returned HTTP {response.status_code}')
+        if not response['Content-Type'].startswith('text/html'):
+            raise CommandError(f'{url} is not an HTML page ({response["Content-Type"]})')
+        if b'csrfmiddlewaretoken' in response.content:
+            # A baked-in CSRF token matches no visitor's cookie, so the form
+            # would always be rejected. Without a file the server falls
+            # through to Django for this page.
+            self.stdout.write(self.style.WARNING(f'Skipped {url}: it has a CSRF-protected form'))
+            return
+
+        content = response.content
+        if self.new_static_url:
+            content = self.static_pattern.sub(
+                lambda match: match.group(1) + self.new_static_url, content.decode(response.charset)
+            ).encode(response.charset)
+
+        write_atomic(output / url.lstrip('/') / 'index.html', content)
+        self.stdout.write(self.style.SUCCESS(f'Exported {url}'))
+
+    def copy_static(self, static_dir):
+        # Collected files include the hashed names {% static %} links to
+        if settings.STATIC_ROOT and Path(settings.STATIC_ROOT).is_dir():
+            shutil.copytree(settings.STATIC_ROOT, static_dir, dirs_exist_ok=True)
+            return sum(1 for path in static_dir.rglob('*') if path.is_file())
+
+        copied = set()
+        for finder in get_finders():
+            for path, storage in finder.list(STATIC_IGNORE):
+                # Like collectstatic, the first finder to provide a path wins
+                if path in copied:
+                    continue
+                target = static_dir / path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(storage.path(path), target)
+                copied.add(path)
+        return len(copied)
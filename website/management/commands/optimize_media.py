@@ -0,0 +1,241 @@
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from website.media.batch import DEFAULT_WORKERS, encode_all
+from website.media.build_cache import BuildCache, file_digest
+from website.media.manifest import ResponsiveManifest
+from website.media.rules import RULES, RULES_BY_NAME, MediaRule
+from website.media.video import VideoToolMissing
+from website.utils import write_atomic
+
+MEDIA_ROOT = settings.BASE_DIR / 'website' / 'static' / 'website'
+DEFAULT_CACHE = settings.BASE_DIR / 'media_build_cache.json'
+DEFAULT_ORIGINALS = settings.BASE_DIR / 'media_originals'
+
+# Re-encoding an already optimized file in place only pays off above this
+MIN_SAVING = 0.1
+
+
+@dataclass
+class PlannedFile:
+    """A file that needs encoding, and where its result goes"""
+
+    rule: MediaRule
+    path: Path
+    output: Path
+    # Build cache key (output) and source, relative to the media root
+    name: str
+    source: str
+    # What gets encoded: ``path``, or the archived original of an earlier build
+    original: Path
+
+
+class Command(BaseCommand):
+    help = 'Resize and recompress the site images and videos, skipping files that are already done'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rule',
+            nargs='+',
+            choices=sorted(RULES_BY_NAME),
+            help='Only process these directories',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-encode every file, even ones the build cache says are current',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the files that would be processed without changing anything',
+        )
+        parser.add_argument(
+            '--adopt',
+            action='store_true',
+            help='Record the current files as optimized without re-encoding them',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help='Number of processes encoding files in parallel (default: one per core)',
+        )
+        parser.add_argument(
+            '--cache',
+            default=str(DEFAULT_CACHE),
+            help='Build cache file (default: media_build_cache.json)',
+        )
+        parser.add_argument(
+            '--originals',
+            default=str(DEFAULT_ORIGINALS),
+            help='Where replaced source files are kept (default: media_originals/)',
+        )
+        parser.add_argument(
+            '--manifest',
+            default=str(settings.RESPONSIVE_IMAGES_MANIFEST),
+            help='Responsive image manifest to update (default: RESPONSIVE_IMAGES_MANIFEST)',
+        )
+        parser.add_argument(
+            '--root',
+            default=str(MEDIA_ROOT),
+            help='Directory the rules are relative to (default: website/static/website)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        self.root = Path(options['root'])
+        self.originals = Path(options['originals'])
+        self.cache = BuildCache.load(Path(options['cache']))
+        self.manifest = ResponsiveManifest.load(Path(options['manifest']))
+        self.options = options
+        rules = [RULES_BY_NAME[name] for name in options['rule']] if options['rule'] else RULES
+
+        self.counts = {'optimized': 0, 'kept': 0, 'current': 0, 'failed': 0}
+        planned = []
+        for rule in rules:
+            directory = self.root / rule.directory
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.iterdir()):
+                job = self.plan(rule, path) if rule.matches(path) else None
+                if job is not None:
+                    planned.append(job)
+
+        # Encoding runs in worker processes; results are applied here in plan order
+        self.missing_tools = set()
+        try:
+            results = encode_all([(job.rule, job.original) for job in planned], options['workers'])
+            for position, (job, (_, encoded, error)) in enumerate(zip(planned, results), 1):
+                self.apply(job, encoded, error, f'[{position}/{len(planned)}]')
+        finally:
+            if not options['dry_run']:
+                self.cache.save()
+                self.manifest.save()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        summary = ', '.join(f'{count} {state}' for state, count in self.counts.items())
+        self.stdout.write(self.style.SUCCESS(f'{summary} in {elapsed_ms:.0f} ms'))
+        if self.counts['failed']:
+            raise CommandError(f'{self.counts["failed"]} file(s) could not be optimized')
+
+    def plan(self, rule, path):
+        """A ``PlannedFile`` if ``path`` needs encoding, else None"""
+        output = rule.output_path(path)
+        name = output.relative_to(self.root).as_posix()
+        source = path.relative_to(self.root).as_posix()
+        in_place = path == output
+
+        if (
+            in_place
+            and not self.options['force']
+            and self.cache.is_current(name, path, rule.recipe)
+            and self.has_variants(rule, name)
+        ):
+            self.counts['current'] += 1
+            return None
+        if self.options['dry_run']:
+            self.stdout.write(f'Would optimize {source}')
+            return None
+        if self.options['adopt']:
+            if in_place:
+                self.cache.record(name, path, source, file_digest(path), rule.recipe)
+                self.counts['kept'] += 1
+            return None
+        return PlannedFile(rule, path, output, name, source, self.original_source(name, path, rule))
+
+    def has_variants(self, rule, name):
+        """Whether the responsive variants recorded for ``name`` are all still there"""
+        if not rule.widths:
+            return True
+        variants = self.cache.get(name).get('variants')
+        return bool(variants) and all((self.root / variant).is_file() for variant in variants)
+
+    def apply(self, job, encoded, error, progress):
+        """Write one encoded file and its variants, archive its source and record it in the build cache"""
+        if isinstance(error, VideoToolMissing):
+            if job.rule.name not in self.missing_tools:
+                self.missing_tools.add(job.rule.name)
+                self.stdout.write(self.style.WARNING(f'Skipped {job.rule.name}: {error}'))
+            return
+        if error is not None:
+            self.stderr.write(self.style.ERROR(f'{progress} Error optimizing {job.source}: {error}'))
+            self.counts['failed'] += 1
+            return
+
+        data = encoded.data
+        variants = self.write_variants(job, encoded.variants)
+        in_place = job.path == job.output
+        source_hash = file_digest(job.original)
+        size = job.original.stat().st_size
+        if (
+            in_place
+            and job.original == job.path
+            and job.rule.keep_if_not_smaller
+            and len(data) > size * (1 - MIN_SAVING)
+        ):
+            # Already about as small as this rule makes it
+            self.cache.record(job.name, job.path, job.source, source_hash, job.rule.recipe, variants)
+            self.counts['kept'] += 1
+            return
+
+        if job.original == job.path:
+            self.archive(job.path, job.source)
+        write_atomic(job.output, data)
+        if not in_place:
+            job.path.unlink()
+        self.cache.record(job.name, job.output, job.source, source_hash, job.rule.recipe, variants)
+        self.counts['optimized'] += 1
+        self.stdout.write(f'{progress} Optimized {job.source}: {size / 1024:.0f} KB -> {len(data) / 1024:.0f} KB')
+
+    def write_variants(self, job, variants):
+        """Write the responsive variants of one file and list them in the manifest
+
+        Variants an earlier build made that this one no longer does are
+        deleted. Returns the variant names, relative to the media root.
+        """
+        written = []
+        for variant in variants:
+            path = job.rule.variant_path(job.output, variant)
+            write_atomic(path, variant.data)
+            written.append((variant, path.relative_to(self.root).as_posix()))
+
+        names = [name for _, name in written]
+        previous = (self.cache.get(job.name) or {}).get('variants', [])
+        for name in set(previous) - set(names):
+            (self.root / name).unlink(missing_ok=True)
+
+        # Manifest keys and paths are what templates pass to {% static %}
+        key = f'{self.root.name}/{job.name}'
+        if written:
+            largest = max((variant for variant, _ in written), key=lambda variant: variant.width)
+            self.manifest.update(key, largest.width, largest.height, [
+                (variant.format, variant.width, f'{self.root.name}/{name}') for variant, name in written
+            ])
+        else:
+            self.manifest.entries.pop(key, None)
+        return names
+
+    def original_source(self, name, path, rule):
+        """The archived original when ``path`` is our own earlier output of it
+
+        Lets a changed rule re-encode from the full-quality file instead of
+        compressing the previous output again.
+        """
+        entry = self.cache.get(name)
+        if entry is None or file_digest(path) != entry['output']:
+            return path
+        original = self.originals / entry['source']
+        if original.is_file() and file_digest(original) == entry['source_hash']:
+            return original
+        return path
+
+    def archive(self, path, source):
+        target = self.originals / source
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, target)
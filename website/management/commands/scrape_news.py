@@ -1,10 +1,26 @@
-import requests
 import re
+import time
+from dataclasses import asdict
 from datetime import datetime, timedelta
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 from django.utils import timezone
-from bs4 import BeautifulSoup
-from website.models import NewsArticle
+from bjs_website.sqlite import enable_wal
+from website.models import NewsArticle, ScrapeRun, SourceRunStats
+from website.news_cache import bump_generation
+from website.scraping.cache import ConditionalCache
+from website.scraping.classifier import KeywordClassifier
+from website.scraping.fetch import DEFAULT_MAX_WORKERS, SessionPool, fetch, fetch_sources
+from website.scraping.dedupe import NearDuplicateIndex, title_fingerprint
+from website.scraping.enrich import ArticleEnricher
+from website.scraping.feeds import FeedReader
+from website.scraping.ingest import ingest_articles, unseen_articles
+from website.scraping.parsers import PARSERS
+from website.scraping.replay import FixtureArchive, RecordingPool, ReplayPool
+from website.scraping.scheduler import DEFAULT_MAX_BACKOFF, Scheduler
+from website.scraping.stats import SourceStats
+from website.scraping.sources import FEEDS, MYBROADBAND, NEWS24, SOURCES
 
 class Command(BaseCommand):
     help = 'Scrape IT news from News24 and MyBroadband'
@@ -25,6 +41,11 @@ class Command(BaseCommand):
         'telecommunications', 'telecom', 'fiber', 'broadband', '5g', '4g', 'wireless'
     ]
 
+    classifier = KeywordClassifier(
+        [('solar', POWER_SOLAR_KEYWORDS), ('ict', ICT_KEYWORDS)],
+        default='ict',
+    )
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--max-articles',
@@ -32,188 +53,423 @@ class Command(BaseCommand):
             default=10,
             help='Maximum number of articles to scrape per source',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help='Maximum number of sources to fetch concurrently',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Parse every listing page even if it has not changed since the last run',
+        )
+        parser.add_argument(
+            '--enrich',
+            action='store_true',
+            help='Fetch each new article page for its real publish date and summary',
+        )
+        parser.add_argument(
+            '--detail-rate',
+            type=float,
+            default=1.0,
+            help='Article page requests per second allowed per site when enriching',
+        )
+        parser.add_argument(
+            '--detail-workers',
+            type=int,
+            default=4,
+            help='Maximum number of article pages fetched concurrently when enriching',
+        )
+        parser.add_argument(
+            '--feeds',
+            action='store_true',
+            help='Read sources from their RSS/Atom feeds where they have one',
+        )
+        parser.add_argument(
+            '--record',
+            metavar='DIR',
+            help='Save every fetched page and its headers into a fixture archive',
+        )
+        parser.add_argument(
+            '--replay',
+            metavar='DIR',
+            help='Serve pages from a fixture archive instead of the live sites',
+        )
+        parser.add_argument(
+            '--daemon',
+            action='store_true',
+            help='Keep running and scrape each source on its own interval',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=None,
+            help='Seconds between scrapes of each source in daemon mode (default: per source)',
+        )
+        parser.add_argument(
+            '--max-backoff',
+            type=float,
+            default=DEFAULT_MAX_BACKOFF,
+            help='Longest delay in seconds before retrying a failing source in daemon mode',
+        )
+        parser.add_argument(
+            '--export',
+            metavar='DIR',
+            help='Re-export the news page into a site written by export_site when articles were added',
+        )
     
     def categorize_article(self, title, summary):
         """Determine article category based on title and summary content"""
-        text = (title + ' ' + summary).lower()
-        
-        # Count matches for each category
-        power_matches = sum(1 for keyword in self.POWER_SOLAR_KEYWORDS if keyword in text)
-        ict_matches = sum(1 for keyword in self.ICT_KEYWORDS if keyword in text)
-        
-        # Prioritize power/solar if there are matches (since ICT sites often cover energy news)
-        if power_matches > 0:
-            return 'solar'
-        elif ict_matches > 0:
-            return 'ict'
-        else:
-            # Default to ICT for tech sites, but could be refined
-            return 'ict'
+        # Power/solar takes priority (since ICT sites often cover energy news);
+        # anything else defaults to ICT for tech sites
+        return self.classifier.classify(title + ' ' + summary)
 
     def handle(self, *args, **options):
         max_articles = options['max_articles']
+        # So the web server keeps reading while this writes
+        enable_wal()
         
-        self.stdout.write(self.style.SUCCESS('Starting news scraping...'))
+        if options['daemon']:
+            return self.run_daemon(options)
         
-        # Scrape News24
-        news24_count = self.scrape_news24(max_articles)
+        self.stdout.write(self.style.SUCCESS('Starting news scraping...'))
+        started_date = timezone.now()
+        started = time.perf_counter()
+        self.source_stats = {}
         
-        # Scrape MyBroadband
-        mybroadband_count = self.scrape_mybroadband(max_articles)
+        # Fetch every listing page concurrently, then parse and store them one by one
+        sources = self.active_sources(options)
+        self.conditional_cache = None if options['force'] else ConditionalCache.load(
+            source.url for source in sources
+        )
+        with self.build_pool(options) as pool:
+            self.session_pool = pool
+            self.enricher = self.build_enricher(pool, options)
+            results = fetch_sources(
+                sources, pool, max_workers=options['workers'], cache=self.conditional_cache,
+            )
+            counts = {
+                source.key: self.scrape_source(source, max_articles, results[source.key])
+                for source in sources
+            }
         
         # Clean up old articles (older than 30 days)
-        self.cleanup_old_articles()
+        removed = self.cleanup_old_articles()
+        self.record_run(started_date, started)
+        self.invalidate_news_page(options['export'], removed)
         
         # Show category breakdown
         ict_total = NewsArticle.objects.filter(category='ict', is_active=True).count()
         solar_total = NewsArticle.objects.filter(category='solar', is_active=True).count()
         
+        per_source = ''.join(f'{source.name} articles: {counts[source.key]}\n' for source in sources)
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f'News scraping completed successfully!\n'
-                f'News24 articles: {news24_count}\n'
-                f'MyBroadband articles: {mybroadband_count}\n'
-                f'Total new articles: {news24_count + mybroadband_count}\n'
+                f'{per_source}'
+                f'Total new articles: {sum(counts.values())}\n'
                 f'\nCurrent database totals:\n'
                 f'ICT News: {ict_total} articles\n'
                 f'Solar & Power News: {solar_total} articles'
             )
         )
 
-    def scrape_news24(self, max_articles):
+    def scrape_news24(self, max_articles, result=None):
         """Scrape IT-related news from News24"""
-        count = 0
+        return self.scrape_source(NEWS24, max_articles, result)
+
+    def scrape_mybroadband(self, max_articles, result=None):
+        """Scrape IT news from MyBroadband"""
+        return self.scrape_source(MYBROADBAND, max_articles, result)
+
+    def scrape_source(self, source, max_articles, result=None):
+        """Parse one source's listing page and store any new articles
+
+        ``result`` is a pre-fetched ``FetchResult``; when omitted the listing
+        page is downloaded here. Errors are reported rather than raised.
+        """
         try:
-            # Search for IT/technology related news on News24
-            url = "https://www.news24.com/tags/topics/it"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find article links and titles
-            articles = soup.find_all('article', class_=lambda x: x and 'article' in x.lower())[:max_articles]
-            
-            for article in articles:
-                try:
-                    title_elem = article.find(['h1', 'h2', 'h3'], class_=lambda x: x and 'title' in x.lower())
-                    if not title_elem:
-                        title_elem = article.find('a')
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link_elem = title_elem if title_elem.name == 'a' else title_elem.find('a')
-                        
-                        if link_elem and link_elem.get('href'):
-                            url = link_elem['href']
-                            if not url.startswith('http'):
-                                url = 'https://www.news24.com' + url
-                            
-                            # Get article summary
-                            summary_elem = article.find('p', class_=lambda x: x and ('summary' in x.lower() or 'excerpt' in x.lower()))
-                            if not summary_elem:
-                                summary_elem = article.find('p')
-                            
-                            summary = summary_elem.get_text(strip=True)[:500] if summary_elem else title[:200] + "..."
-                            
-                            # Determine category based on content
-                            category = self.categorize_article(title, summary)
-                            
-                            # Check if article already exists
-                            if not NewsArticle.objects.filter(title=title, source='news24').exists():
-                                NewsArticle.objects.create(
-                                    title=title,
-                                    summary=summary,
-                                    url=url,
-                                    source='news24',
-                                    category=category,
-                                    published_date=timezone.now(),
-                                )
-                                count += 1
-                                self.stdout.write(f'  Added News24 article ({category}): {title[:50]}...')
-                                
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f'Error processing News24 article: {e}'))
-                    continue
-                    
+            return self.process_source(source, max_articles, result)
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f'Error scraping News24: {e}'))
-            
-        return count
+            self.source_stats[source.key].errors += 1
+            self.stdout.write(self.style.ERROR(f'Error scraping {source.name}: {e}'))
+            return 0
 
-    def scrape_mybroadband(self, max_articles):
-        """Scrape IT news from MyBroadband"""
+    def process_source(self, source, max_articles, result=None):
+        """Like ``scrape_source`` but lets fetch and storage errors propagate
+
+        Timings and counts for the source are kept in ``self.source_stats``.
+        """
+        stats = self.start_stats(source)
         count = 0
-        try:
-            # MyBroadband main page
-            url = "https://mybroadband.co.za/news"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find article links
-            articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('post' in x.lower() or 'article' in x.lower()))[:max_articles]
-            
-            for article in articles:
-                try:
-                    title_elem = article.find(['h1', 'h2', 'h3'])
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        
-                        # Find the link
-                        link_elem = title_elem.find('a') or article.find('a')
-                        if link_elem and link_elem.get('href'):
-                            url = link_elem['href']
-                            if not url.startswith('http'):
-                                url = 'https://mybroadband.co.za' + url
-                            
-                            # Get summary
-                            summary_elem = article.find('p', class_=lambda x: x and ('excerpt' in x.lower() or 'summary' in x.lower()))
-                            if not summary_elem:
-                                summary_elem = article.find('p')
-                            
-                            summary = summary_elem.get_text(strip=True)[:500] if summary_elem else title[:200] + "..."
-                            
-                            # Determine category based on content
-                            category = self.categorize_article(title, summary)
+        if result is None:
+            result = self.fetch_source(source)
+        stats.fetch_ms = result.elapsed * 1000
+        result.raise_for_error()
+        if result.unchanged:
+            stats.unchanged = True
+            self.stdout.write(f'  {source.name} unchanged since last run, skipping')
+            return count
+        
+        started = time.perf_counter()
+        if source.kind == 'feed':
+            extracted = self.read_feed(source, result, max_articles, stats)
+        else:
+            extracted = self.read_listing(source, result, max_articles, stats)
+        
+        # Determine categories for the whole page in one batch
+        categories = self.classifier.classify_many(
+            article.title + ' ' + article.summary for article in extracted
+        )
+        parsed = [
+            NewsArticle(
+                title=article.title,
+                summary=article.summary,
+                url=article.url,
+                source=source.key,
+                category=category,
+                published_date=article.published or timezone.now(),
+                guid=article.guid,
+                fingerprint=title_fingerprint(article.title),
+            )
+            for article, category in zip(extracted, categories)
+        ]
+        stats.parse_ms = (time.perf_counter() - started) * 1000
+        stats.articles_seen = len(parsed)
+        
+        # Optionally read real publish dates from the pages of new articles
+        enricher = getattr(self, 'enricher', None)
+        if enricher is not None:
+            parsed = enricher.enrich(unseen_articles(source.key, parsed))
+        
+        # Hide stories another source already covered
+        started = time.perf_counter()
+        duplicate_index = self.get_duplicate_index()
+        for article in parsed:
+            article.duplicate_of_id = duplicate_index.find(article.fingerprint)
+            if article.duplicate_of_id is not None:
+                article.is_active = False
+        
+        # Store the whole page in one transaction; duplicates are skipped
+        new_articles = ingest_articles(source.key, parsed)
+        self.index_new_articles(source, new_articles)
+        stats.db_ms = (time.perf_counter() - started) * 1000
+        stats.articles_new = len(new_articles)
+        stats.articles_duplicate = stats.articles_seen - stats.articles_new
+        
+        for article in new_articles:
+            count += 1
+            if article.duplicate_of_id is not None:
+                self.stdout.write(f'  Added {source.name} near-duplicate (hidden): {article.title[:50]}...')
+            else:
+                self.stdout.write(f'  Added {source.name} article ({article.category}): {article.title[:50]}...')
+        
+        self.remember_page(result)
+        return count
+
+    def read_listing(self, source, result, max_articles, stats):
+        """Extract articles from an HTML listing page"""
+        parser = PARSERS[source.key]
+        stats.bytes_downloaded = len(result.response.content)
+        
+        # Only the article containers are built into a tree
+        containers = parser.containers(result.response.content, max_articles)
+        extracted = []
+        
+        for container in containers:
+            try:
+                article = parser.extract(container)
+                if article:
+                    extracted.append(article)
                             
-                            # Check if article already exists
-                            if not NewsArticle.objects.filter(title=title, source='mybroadband').exists():
-                                NewsArticle.objects.create(
-                                    title=title,
-                                    summary=summary,
-                                    url=url,
-                                    source='mybroadband',
-                                    category=category,
-                                    published_date=timezone.now(),
-                                )
-                                count += 1
-                                self.stdout.write(f'  Added MyBroadband article ({category}): {title[:50]}...')
-                                
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f'Error processing MyBroadband article: {e}'))
-                    continue
-                    
+            except Exception as e:
+                stats.errors += 1
+                self.stdout.write(self.style.WARNING(f'Error processing {source.name} article: {e}'))
+                continue
+        
+        return extracted
+
+    def read_feed(self, source, result, max_articles, stats):
+        """Stream new items from an RSS/Atom feed, stopping at the first known GUID"""
+        known_guids = (
+            NewsArticle.objects.filter(source=source.key)
+            .exclude(guid='')
+            .values_list('guid', flat=True)
+        )
+        reader = FeedReader(max_articles, known_guids)
+        extracted = reader.read_response(result.response)
+        stats.bytes_downloaded = reader.bytes_read
+        if reader.reached_known:
+            self.stdout.write(f'  {source.name} feed: stopped at a known item after {len(extracted)} new')
+        return extracted
+
+    def start_stats(self, source):
+        """Fresh ``SourceStats`` for ``source``, replacing any from an earlier run"""
+        if not hasattr(self, 'source_stats'):
+            self.source_stats = {}
+        stats = self.source_stats[source.key] = SourceStats(source.key)
+        return stats
+
+    def run_daemon(self, options):
+        """Scrape every source on its own schedule until interrupted
+
+        The session pool, parsers and conditional cache stay warm between
+        cycles, and a failing source backs off without holding up the rest.
+        """
+        sources = self.active_sources(options)
+        scheduler = Scheduler(
+            sources,
+            interval=options['interval'],
+            max_backoff=options['max_backoff'],
+        )
+        self.conditional_cache = None if options['force'] else ConditionalCache.load(
+            source.url for source in sources
+        )
+        self.stdout.write(self.style.SUCCESS('Starting news scraping daemon (Ctrl+C to stop)...'))
+        
+        with self.build_pool(options) as pool:
+            self.session_pool = pool
+            self.enricher = self.build_enricher(pool, options)
+            try:
+                while True:
+                    due = scheduler.due()
+                    if due:
+                        self.run_cycle(scheduler, due, options)
+                    time.sleep(scheduler.seconds_until_next())
+            except KeyboardInterrupt:
+                self.stdout.write(self.style.SUCCESS('News scraping daemon stopped'))
+
+    def run_cycle(self, scheduler, due, options):
+        """Fetch and process the sources that are due, then reschedule them"""
+        close_old_connections()
+        self.duplicate_index = None
+        self.source_stats = {}
+        started_date = timezone.now()
+        started = time.perf_counter()
+        sources = [schedule.source for schedule in due]
+        results = fetch_sources(
+            sources, self.session_pool, max_workers=options['workers'], cache=self.conditional_cache,
+        )
+        
+        for source in sources:
+            try:
+                count = self.process_source(source, options['max_articles'], results[source.key])
+            except Exception as e:
+                self.source_stats[source.key].errors += 1
+                delay = scheduler.record(source.key, ok=False)
+                self.stdout.write(self.style.ERROR(
+                    f'Error scraping {source.name}: {e} (retrying in {delay:.0f}s)'
+                ))
+            else:
+                delay = scheduler.record(source.key, ok=True)
+                self.stdout.write(f'{source.name}: {count} new articles, next run in {delay:.0f}s')
+        
+        try:
+            removed = self.cleanup_old_articles()
+            self.record_run(started_date, started, daemon=True)
+            self.invalidate_news_page(options['export'], removed)
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f'Error scraping MyBroadband: {e}'))
-            
-        return count
+            # A locked database or a failed export must not stop the daemon;
+            # the next cycle cleans up, records and exports again
+            self.stdout.write(self.style.ERROR(f'Error finishing scrape cycle: {e}'))
+        close_old_connections()
+
+    def get_duplicate_index(self):
+        """Banded SimHash index of recent articles, loaded once per run or cycle"""
+        index = getattr(self, 'duplicate_index', None)
+        if index is None:
+            index = self.duplicate_index = NearDuplicateIndex.recent()
+        return index
+
+    def index_new_articles(self, source, articles):
+        """Add freshly stored originals to the index so later sources are checked against them"""
+        fingerprints = {
+            article.title: article.fingerprint
+            for article in articles
+            if article.duplicate_of_id is None
+        }
+        if not fingerprints:
+            return
+        index = self.get_duplicate_index()
+        stored = NewsArticle.objects.filter(source=source.key, title__in=list(fingerprints))
+        for pk, title in stored.values_list('id', 'title'):
+            index.add(pk, fingerprints[title])
+
+    def active_sources(self, options):
+        """Sources to scrape, with feeds swapped in for listing pages when asked"""
+        sources = dict(SOURCES)
+        if options['feeds']:
+            sources.update(FEEDS)
+        return list(sources.values())
+
+    def build_pool(self, options):
+        """Live sessions, or ones that record to / replay from a fixture archive"""
+        if options['replay']:
+            return ReplayPool(FixtureArchive(options['replay']))
+        if options['record']:
+            return RecordingPool(FixtureArchive(options['record']))
+        return SessionPool()
+
+    def build_enricher(self, pool, options):
+        if not options['enrich']:
+            return None
+        return ArticleEnricher(
+            pool,
+            rate=options['detail_rate'],
+            max_workers=options['detail_workers'],
+        )
+
+    def fetch_source(self, source):
+        """Fetch a single source's listing page outside of ``handle``"""
+        pool = getattr(self, 'session_pool', None)
+        if pool is None:
+            pool = self.session_pool = SessionPool()
+        cache = getattr(self, 'conditional_cache', None)
+        if cache is None:
+            return fetch(source.url, pool, source.timeout)
+        return cache.check(fetch(source.url, pool, source.timeout, cache.request_headers(source.url)))
+
+    def remember_page(self, result):
+        """Record a successfully processed page so an identical one is skipped next time"""
+        cache = getattr(self, 'conditional_cache', None)
+        if cache is not None:
+            cache.store(result)
+
+    def record_run(self, started_date, started, daemon=False):
+        """Store this run's per-source stats as a ``ScrapeRun``"""
+        run = ScrapeRun.objects.create(
+            started_date=started_date,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            daemon=daemon,
+        )
+        SourceRunStats.objects.bulk_create(
+            SourceRunStats(run=run, **asdict(stats)) for stats in self.source_stats.values()
+        )
+        return run
+
+    def invalidate_news_page(self, export_dir=None, removed=0):
+        """Start a new news page generation if this run added or removed articles
+
+        Bulk inserts don't send model signals, so the scraper bumps it itself.
+        """
+        if not removed and not any(stats.articles_new for stats in self.source_stats.values()):
+            return
+        bump_generation()
+        if export_dir:
+            call_command('export_site', '--output', export_dir, '--only', 'news', stdout=self.stdout)
 
     def cleanup_old_articles(self):
-        """Remove articles older than 30 days"""
+        """Remove articles older than 30 days; returns how many there were"""
         cutoff_date = timezone.now() - timedelta(days=30)
         old_articles = NewsArticle.objects.filter(scraped_date__lt=cutoff_date)
         count = old_articles.count()
         old_articles.delete()
         
         if count > 0:
-            self.stdout.write(self.style.SUCCESS(f'Cleaned up {count} old articles'))
\ No newline at end of file
+            self.stdout.write(self.style.SUCCESS(f'Cleaned up {count} old articles'))
+        
+        # Run history is kept for the same 30 days
+        ScrapeRun.objects.filter(started_date__lt=cutoff_date).delete()
+        return count
\ No newline at end of file
@@ -0,0 +1 @@
+"""Image and video optimization used by the ``optimize_media`` command."""
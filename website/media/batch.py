@@ -0,0 +1,31 @@
+"""Encode many files at once, one worker process per core.
+
+The encoders are CPU-bound Pillow/ffmpeg calls, so threads would queue on
+the GIL. Results come back in job order and each worker only returns bytes,
+so what gets written doesn't depend on the number of workers.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+
+def encode(job):
+    """``(EncodedMedia, None)`` on success, ``(None, error)`` if the encoder failed"""
+    rule, path = job
+    try:
+        return rule.process(path), None
+    except Exception as e:
+        return None, e
+
+
+def encode_all(jobs, workers=DEFAULT_WORKERS):
+    """Yield ``(job, encoded, error)`` for each ``(rule, path)`` job, in order"""
+    jobs = list(jobs)
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield (job, *encode(job))
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        for job, (encoded, error) in zip(jobs, executor.map(encode, jobs)):
+            yield job, encoded, error
@@ -0,0 +1,65 @@
+"""Record of what ``optimize_media`` produced, so unchanged files are skipped.
+
+Entries are keyed by output path (relative to ``website/static/website``)
+and hold the hashes of the source and of the output the build wrote. A
+file whose size and mtime still match is current without reading it; one
+that was touched but not changed costs a hash.
+"""
+import hashlib
+import json
+
+from website.utils import write_atomic
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path) as f:
+                return cls(path, json.load(f))
+        except FileNotFoundError:
+            return cls(path)
+
+    def save(self):
+        write_atomic(self.path, (json.dumps(self.entries, indent=2, sort_keys=True) + '\n').encode())
+
+    def get(self, name):
+        return self.entries.get(name)
+
+    def is_current(self, name, path, recipe):
+        """Whether ``path`` is the output this cache recorded for ``recipe``"""
+        entry = self.entries.get(name)
+        if entry is None or entry['recipe'] != recipe:
+            return False
+        stat = path.stat()
+        if entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return True
+        if file_digest(path) != entry['output']:
+            return False
+        # Same bytes, new mtime (e.g. a fresh checkout): remember the new stat
+        entry['size'], entry['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+        return True
+
+    def record(self, name, path, source, source_hash, recipe, variants=()):
+        stat = path.stat()
+        self.entries[name] = {
+            'source': source,
+            'source_hash': source_hash,
+            'output': file_digest(path),
+            'recipe': recipe,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'variants': list(variants),
+        }
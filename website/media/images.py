@@ -0,0 +1,127 @@
+"""Image encoders for the media pipeline.
+
+Each takes a source path and returns the encoded bytes, so the caller
+decides where (and whether) to write them.
+"""
+from dataclasses import dataclass
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, features
+
+from .alpha import key_background
+
+# Responsive variant formats, best first; JPEG is the fallback every browser takes
+VARIANT_FORMATS = tuple(
+    fmt for fmt, available in (('avif', features.check('avif')), ('webp', features.check('webp'))) if available
+) + ('jpeg',)
+
+VARIANT_QUALITY = {'avif': 60, 'webp': 80, 'jpeg': 85}
+
+
+def fit_within(size, max_width, max_height):
+    """Largest size with the same aspect ratio that fits the bounds"""
+    width, height = size
+    if width <= max_width and height <= max_height:
+        return size
+    aspect_ratio = width / height
+    if aspect_ratio > max_width / max_height:
+        # Width is the limiting factor
+        return max_width, int(max_width / aspect_ratio)
+    return int(max_height * aspect_ratio), max_height
+
+
+def compress_image(input_path, max_width=1920, max_height=1080, quality=85):
+    """Resize to fit ``max_width`` x ``max_height`` and encode as an optimized JPEG"""
+    with Image.open(input_path) as img:
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        size = fit_within(img.size, max_width, max_height)
+        if size != img.size:
+            img = img.resize(size, Image.Resampling.LANCZOS)
+        output = BytesIO()
+        img.save(output, 'JPEG', quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def has_alpha(img):
+    """Whether any pixel of ``img`` is transparent; a fully opaque alpha channel doesn't count"""
+    if 'A' in img.getbands():
+        alpha = img.getchannel('A')
+    elif 'transparency' in img.info:
+        alpha = img.convert('RGBA').getchannel('A')
+    else:
+        return False
+    return alpha.getextrema() != (255, 255)
+
+
+def exact_palette(img):
+    """Palette copy of ``img`` if it has at most 256 colours, else ``img``
+
+    Unlike ``quantize()`` every pixel keeps its exact colour and alpha, so
+    the PNG just gets smaller.
+    """
+    if img.getcolors(256) is None:
+        return img
+    pixels = np.ascontiguousarray(np.asarray(img.convert('RGBA')))
+    # One uint32 per pixel makes the colour lookup a 1-D np.unique
+    packed = pixels.view(np.uint32)[..., 0]
+    colors, indices = np.unique(packed, return_inverse=True)
+    palette = Image.fromarray(indices.reshape(packed.shape).astype(np.uint8), 'P')
+    palette.putpalette(colors.view(np.uint8).tobytes(), rawmode='RGBA')
+    return palette
+
+
+def convert_image_to_png(input_path, background=None, key=None, key_threshold=15, feather=0):
+    """Encode as an optimized PNG, keeping transparency unless ``background`` is given
+
+    ``background`` is an RGB colour to flatten transparent areas onto.
+    ``key`` is an RGB colour made transparent in images without transparency
+    of their own, e.g. the white box around a logo (see ``key_background``).
+    """
+    with Image.open(input_path) as img:
+        if has_alpha(img):
+            img = img.convert('RGBA')
+            if background is not None:
+                flattened = Image.new('RGBA', img.size, (*background, 255))
+                flattened.paste(img, (0, 0), img)
+                img = flattened.convert('RGB')
+        elif key is not None:
+            img = key_background(img.convert('RGB'), key, key_threshold, feather)
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+        output = BytesIO()
+        exact_palette(img).save(output, 'PNG', optimize=True)
+    return output.getvalue()
+
+
+@dataclass(frozen=True)
+class Variant:
+    width: int
+    height: int
+    format: str
+    data: bytes
+
+
+def responsive_variants(input_path, widths, max_width=None, max_height=None):
+    """The image at each of ``widths`` (no upscaling) in every ``VARIANT_FORMATS``
+
+    Sizes are capped at ``max_width`` x ``max_height`` like the main image,
+    so the largest variant is never bigger than it.
+    """
+    with Image.open(input_path) as img:
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        limit = fit_within(img.size, max_width or img.width, max_height or img.height)
+        sizes = sorted({
+            fit_within(img.size, min(width, limit[0]), img.height) for width in widths
+        })
+        variants = []
+        for size in sizes:
+            resized = img.resize(size, Image.Resampling.LANCZOS) if size != img.size else img
+            for fmt in VARIANT_FORMATS:
+                output = BytesIO()
+                options = {'optimize': True, 'progressive': True} if fmt == 'jpeg' else {}
+                resized.save(output, fmt.upper(), quality=VARIANT_QUALITY[fmt], **options)
+                variants.append(Variant(size[0], size[1], fmt, output.getvalue()))
+    return variants
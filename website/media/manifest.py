@@ -0,0 +1,65 @@
+"""Responsive image manifest: the variants ``optimize_media`` wrote per image.
+
+Keys and paths are static paths (as passed to ``{% static %}``)::
+
+    {"website/images/hero/banner1.jpg": {
+        "width": 1920, "height": 1080,
+        "sources": {"avif": [[640, "website/images/hero/variants/banner1-640.avif"], ...],
+                    "webp": [...], "jpeg": [...]}}}
+
+The ``{% responsive_image %}`` tag reads it through ``load_manifest``, which
+parses the file once and again only when it changes.
+"""
+import json
+import os
+from functools import lru_cache
+
+from django.conf import settings
+
+from website.utils import write_atomic
+
+
+class ResponsiveManifest:
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path) as f:
+                return cls(path, json.load(f))
+        except FileNotFoundError:
+            return cls(path)
+
+    def save(self):
+        write_atomic(self.path, (json.dumps(self.entries, indent=2, sort_keys=True) + '\n').encode())
+
+    def update(self, key, width, height, variants):
+        """``variants`` is a list of ``(format, width, static path)``"""
+        sources = {}
+        for fmt, variant_width, path in sorted(variants, key=lambda variant: variant[1]):
+            sources.setdefault(fmt, []).append([variant_width, path])
+        self.entries[key] = {'width': width, 'height': height, 'sources': sources}
+
+
+@lru_cache(maxsize=4)
+def _read(path, mtime_ns):
+    return ResponsiveManifest.load(path).entries
+
+
+def load_manifest():
+    path = settings.RESPONSIVE_IMAGES_MANIFEST
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _read(path, mtime_ns)
+
+
+def manifest_mtime():
+    """When the manifest last changed, or 0 if there is none yet"""
+    try:
+        return os.path.getmtime(settings.RESPONSIVE_IMAGES_MANIFEST)
+    except FileNotFoundError:
+        return 0
@@ -0,0 +1,83 @@
+"""Which files under ``website/static/website`` are optimized, and how."""
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .alpha import WHITE
+from .images import VARIANT_FORMATS, compress_image, convert_image_to_png, responsive_variants
+from .video import compress_video
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.webm', '.avi', '.mkv')
+
+
+@dataclass(frozen=True)
+class EncodedMedia:
+    """The optimized file plus its responsive variants, if the rule makes any."""
+
+    data: bytes
+    variants: tuple = ()
+
+
+@dataclass(frozen=True)
+class MediaRule:
+    """Encoder and settings for the files directly inside one directory."""
+
+    name: str
+    directory: str
+    extensions: tuple
+    encode: Callable
+    suffix: str
+    options: dict = field(default_factory=dict)
+    # Widths of the responsive variants written to ``<directory>/variants``
+    widths: tuple = ()
+    # Whether an output barely smaller than the file it replaces is dropped;
+    # off for rules that change how the file looks, not just its size
+    keep_if_not_smaller: bool = True
+
+    def matches(self, path):
+        return path.is_file() and path.suffix.lower() in self.extensions
+
+    def output_path(self, path):
+        """Where the optimized copy of ``path`` goes: lower-case name, output format"""
+        return path.with_name(path.stem.lower() + self.suffix)
+
+    @property
+    def recipe(self):
+        """Changes whenever the encoder or its settings do, invalidating old builds"""
+        options = ','.join(f'{key}={value}' for key, value in sorted(self.options.items()))
+        recipe = f'{self.encode.__name__}({options})'
+        if self.widths:
+            recipe += f' variants({",".join(map(str, self.widths))}; {",".join(VARIANT_FORMATS)})'
+        return recipe
+
+    def process(self, path):
+        variants = ()
+        if self.widths:
+            variants = tuple(responsive_variants(
+                path, self.widths, self.options.get('max_width'), self.options.get('max_height'),
+            ))
+        return EncodedMedia(self.encode(path, **self.options), variants)
+
+    def variant_path(self, output, variant):
+        extension = 'jpg' if variant.format == 'jpeg' else variant.format
+        return output.parent / 'variants' / f'{output.stem}-{variant.width}.{extension}'
+
+
+RULES = (
+    MediaRule('hero', 'images/hero', IMAGE_EXTENSIONS, compress_image, '.jpg',
+              {'max_width': 1920, 'max_height': 1080, 'quality': 85}, widths=(640, 1024, 1440, 1920)),
+    MediaRule('about', 'images/about', IMAGE_EXTENSIONS, compress_image, '.jpg',
+              {'max_width': 1200, 'max_height': 800, 'quality': 85}, widths=(480, 800, 1200)),
+    MediaRule('gallery', 'images/gallery', IMAGE_EXTENSIONS, compress_image, '.jpg',
+              {'max_width': 1600, 'max_height': 1200, 'quality': 85}, widths=(480, 800, 1200, 1600)),
+    MediaRule('team', 'images/team', IMAGE_EXTENSIONS, compress_image, '.jpg',
+              {'max_width': 800, 'max_height': 800, 'quality': 85}, widths=(320, 480, 800)),
+    # Partner logos are PNGs whatever format they came in, keeping transparency;
+    # the white box around logos without any is keyed out, with softened edges
+    MediaRule('logos', 'images/logos', IMAGE_EXTENSIONS, convert_image_to_png, '.png',
+              {'key': WHITE, 'key_threshold': 15, 'feather': 8}, keep_if_not_smaller=False),
+    MediaRule('videos', 'videos', VIDEO_EXTENSIONS, compress_video, '.mp4',
+              {'max_width': 1920, 'max_duration': 30, 'crf': 28}),
+)
+
+RULES_BY_NAME = {rule.name: rule for rule in RULES}
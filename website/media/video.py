@@ -0,0 +1,36 @@
+"""Background video encoding through ffmpeg (see VIDEO_COMPRESSION_GUIDE.md)."""
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+
+class VideoToolMissing(RuntimeError):
+    pass
+
+
+def compress_video(input_path, max_width=1920, max_duration=30, crf=28):
+    """Muted H.264 MP4 no wider than ``max_width``, cut to ``max_duration`` seconds"""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise VideoToolMissing('ffmpeg is not installed')
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'output.mp4'
+        subprocess.run(
+            [
+                ffmpeg, '-nostdin', '-loglevel', 'error', '-i', str(input_path),
+                '-t', str(max_duration),
+                # Never upscale; libx264 needs even dimensions
+                '-vf', f"scale='min({max_width},iw)':-2",
+                '-c:v', 'libx264', '-preset', 'slow', '-crf', str(crf),
+                # Background videos play muted
+                '-an',
+                # Start playback before the whole file has downloaded; no
+                # timestamps in the metadata, so reruns give the same bytes
+                '-movflags', '+faststart', '-map_metadata', '-1', '-fflags', '+bitexact',
+                str(output_path),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        return output_path.read_bytes()
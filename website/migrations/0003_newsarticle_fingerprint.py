@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:55
+
+import hashlib
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of website.scraping.dedupe.title_fingerprint as of this
+# migration, so later changes to the app code can't change the backfill
+WORD = re.compile(r'\w+')
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or says '
+    'that the this to was were will with after over new'.split()
+)
+
+
+def title_fingerprint(title):
+    words = [word for word in WORD.findall(title.lower()) if word not in STOPWORDS]
+    features = words + [f'{first} {second}' for first, second in zip(words, words[1:])]
+    weights = [0] * 64
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    # Signed, to fit the BigIntegerField
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def fingerprint_existing_articles(apps, schema_editor):
+    NewsArticle = apps.get_model('website', 'NewsArticle')
+    articles = list(NewsArticle.objects.only('id', 'title'))
+    for article in articles:
+        article.fingerprint = title_fingerprint(article.title)
+    NewsArticle.objects.bulk_update(articles, ['fingerprint'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0002_cachedpage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsarticle',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='website.newsarticle'),
+        ),
+        migrations.AddField(
+            model_name='newsarticle',
+            name='fingerprint',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fingerprint_existing_articles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0003_newsarticle_fingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapeRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_date', models.DateTimeField()),
+                ('duration_ms', models.FloatField(default=0)),
+                ('daemon', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-started_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SourceRunStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('news24', 'News24'), ('mybroadband', 'MyBroadband'), ('manual', 'Manual Entry')], max_length=20)),
+                ('fetch_ms', models.FloatField(default=0)),
+                ('bytes_downloaded', models.PositiveIntegerField(default=0)),
+                ('parse_ms', models.FloatField(default=0)),
+                ('db_ms', models.FloatField(default=0)),
+                ('articles_seen', models.PositiveIntegerField(default=0)),
+                ('articles_new', models.PositiveIntegerField(default=0)),
+                ('articles_duplicate', models.PositiveIntegerField(default=0)),
+                ('unchanged', models.BooleanField(default=False)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sources', to='website.scraperun')),
+            ],
+        ),
+    ]
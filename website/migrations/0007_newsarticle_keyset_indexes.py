@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0006_newsarticle_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_category_listing_idx',
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', '-published_date', '-id'], name='news_category_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-published_date', '-id'], name='news_listing_idx'),
+        ),
+    ]
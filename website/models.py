@@ -22,15 +22,48 @@ class NewsArticle(models.Model):
     published_date = models.DateTimeField()
     scraped_date = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
+    # Feed item GUID, when the article came from an RSS/Atom feed
+    guid = models.CharField(max_length=500, blank=True)
+    # SimHash of the title, used to spot the same story from another source
+    fingerprint = models.BigIntegerField(null=True, blank=True, editable=False)
+    duplicate_of = models.ForeignKey(
+        'self', null=True, blank=True, on_delete=models.SET_NULL, related_name='duplicates'
+    )
     
     class Meta:
         ordering = ['-published_date']
         unique_together = ['title', 'source']
+        indexes = [
+            # News page: latest active articles per category, read in index order.
+            # Partial rather than including is_active, because Django compares
+            # booleans as a bare column on SQLite, which can't seek on an index.
+            #
+            # In both listing indexes, id breaks ties for the keyset-paginated API.
+            models.Index(
+                fields=['category', '-published_date', '-id'],
+                condition=models.Q(is_active=True),
+                name='news_category_listing_idx',
+            ),
+            # API listing without a category filter
+            models.Index(
+                fields=['-published_date', '-id'],
+                condition=models.Q(is_active=True),
+                name='news_listing_idx',
+            ),
+            # Cleanup of articles older than 30 days
+            models.Index(fields=['scraped_date'], name='news_scraped_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.source})"
     
     def time_since_published(self):
+        """Relative age of the article, such as '5 minutes ago'
+
+        Nothing calls this any more: main.js renders the same wording from
+        the ``<time>`` elements, whose text falls back to the absolute date,
+        since a label that changes every minute would defeat the page cache.
+        """
         now = timezone.now()
         diff = now - self.published_date
         
@@ -42,3 +75,46 @@ class NewsArticle(models.Model):
         else:
             minutes = diff.seconds // 60
             return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
+
+
+class CachedPage(models.Model):
+    """HTTP validators and body digest of the last listing page we parsed"""
+    url = models.URLField(max_length=500, unique=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    body_hash = models.CharField(max_length=64, blank=True)
+    fetched_date = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return self.url
+
+
+class ScrapeRun(models.Model):
+    """One ``scrape_news`` run (or one daemon cycle)"""
+    started_date = models.DateTimeField()
+    duration_ms = models.FloatField(default=0)
+    daemon = models.BooleanField(default=False)
+    
+    class Meta:
+        ordering = ['-started_date']
+    
+    def __str__(self):
+        return f"Scrape run at {self.started_date:%Y-%m-%d %H:%M}"
+
+
+class SourceRunStats(models.Model):
+    """Timings and counts for one source within a ``ScrapeRun``"""
+    run = models.ForeignKey(ScrapeRun, on_delete=models.CASCADE, related_name='sources')
+    source = models.CharField(max_length=20, choices=NewsArticle.SOURCE_CHOICES)
+    fetch_ms = models.FloatField(default=0)
+    bytes_downloaded = models.PositiveIntegerField(default=0)
+    parse_ms = models.FloatField(default=0)
+    db_ms = models.FloatField(default=0)
+    articles_seen = models.PositiveIntegerField(default=0)
+    articles_new = models.PositiveIntegerField(default=0)
+    articles_duplicate = models.PositiveIntegerField(default=0)
+    unchanged = models.BooleanField(default=False)
+    errors = models.PositiveIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.get_source_display()} ({self.run})"
@@ -0,0 +1,72 @@
+"""Cache of the rendered news page, keyed on a "generation" counter.
+
+The news page only changes when articles are added, changed or removed, so
+the scraper and the ``NewsArticle`` signals bump the generation whenever that
+happens and the page is cached under the current one. A bump makes every
+older entry unreachable at once, so there is no stale window to wait out.
+
+The counter lives in the same cache as the pages, which therefore has to be
+shared between the web and scraper processes (file, Redis or Memcached;
+not the per-process local-memory backend).
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+GENERATION_KEY = 'news:generation'
+
+
+def news_cache():
+    return caches[settings.NEWS_CACHE_ALIAS]
+
+
+def get_generation():
+    cache = news_cache()
+    # If the counter was evicted, restart from a value no earlier page used
+    cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+    return cache.get(GENERATION_KEY)
+
+
+def bump_generation():
+    cache = news_cache()
+    try:
+        generation = cache.incr(GENERATION_KEY)
+    except ValueError:
+        generation = time.time_ns()
+        cache.set(GENERATION_KEY, generation, timeout=None)
+    # Last-Modified has whole-second precision, so a change within the
+    # second of the previous one still has to move it forward
+    modified = timezone.now()
+    previous = cache.get(page_key('last-modified', generation - 1))
+    if previous is not None:
+        modified = max(modified, previous + timedelta(seconds=1))
+    cache.set(page_key('last-modified', generation), modified, settings.NEWS_CACHE_TIMEOUT)
+    return generation
+
+
+def page_key(name, generation=None):
+    """Cache key for a rendered page (or fragment) at ``generation``"""
+    if generation is None:
+        generation = get_generation()
+    return f'news:{name}:{generation}'
+
+
+def news_etag(request):
+    # Weak, since gzip/br/identity variants share it
+    return f'W/"news-{get_generation()}"'
+
+
+def news_last_modified(request):
+    """When the current generation started
+
+    Recorded by ``bump_generation``, so it moves on every change the ETag
+    does (new articles, edits, deactivations, deletions). A generation whose
+    time was evicted or never recorded counts from its first request.
+    """
+    cache = news_cache()
+    key = page_key('last-modified')
+    cache.add(key, timezone.now(), settings.NEWS_CACHE_TIMEOUT)
+    return cache.get(key)
@@ -0,0 +1,134 @@
+"""Whole-page cache for the views whose HTML doesn't depend on the request.
+
+Pages are cached per path, ``DEPLOY_VERSION`` and template mtime, so a deploy
+that changes assets, or any edit to the template, starts from an empty cache.
+Pages using the responsive image tags are also keyed on the manifest's mtime,
+since an ``optimize_media`` rebuild can delete the variants they link to.
+
+Two things on these pages are per-visitor and are handled separately:
+
+* flash messages: a request that has any is rendered normally and not cached;
+* the CSRF token: the page is rendered with a placeholder in place of the
+  token, and each cached hit gets the visitor's own token swapped in (which
+  also sets the CSRF cookie, as rendering ``{% csrf_token %}`` would).
+
+Pages without a token answer conditional GETs from the same version, so a
+returning visitor's request never reaches the cache. Pages with one get no
+validators and are marked private: a 304 would skip setting the CSRF cookie,
+and a shared cache would hand one visitor's token to the next.
+"""
+import os
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.shortcuts import render
+from django.template.defaulttags import CsrfTokenNode
+from django.template.loader import get_template
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .compression import compressed_variants, variant_response
+from .media.manifest import manifest_mtime
+
+CSRF_PLACEHOLDER = 'csrf-token-placeholder-7f3a2c'
+
+
+def page_cache():
+    return caches[settings.PAGE_CACHE_ALIAS]
+
+
+def page_key(request, template_name):
+    return f'page:{template_version(template_name)}:{request.path}'
+
+
+def is_cacheable(request):
+    return (
+        request.method in ('GET', 'HEAD')
+        and not request.GET
+        and not len(get_messages(request))
+    )
+
+
+def template_mtime(template_name):
+    return os.path.getmtime(get_template(template_name).origin.name)
+
+
+@lru_cache
+def _uses_responsive_images(template_name, mtime):
+    return 'responsive_images' in get_template(template_name).template.source
+
+
+def page_mtimes(template_name):
+    """Modification times of the files a page is rendered from"""
+    mtime = template_mtime(template_name)
+    if _uses_responsive_images(template_name, mtime):
+        return mtime, manifest_mtime()
+    return (mtime,)
+
+
+def template_version(template_name):
+    """Deploy version and page mtimes, shared by the cache key and the ETag"""
+    mtimes = '-'.join(f'{mtime:.0f}' for mtime in page_mtimes(template_name))
+    return f'{settings.DEPLOY_VERSION}-{mtimes}'
+
+
+@lru_cache
+def _has_csrf_token(template_name, mtime):
+    return bool(get_template(template_name).template.nodelist.get_nodes_by_type(CsrfTokenNode))
+
+
+def has_csrf_token(template_name):
+    """Whether ``template_name`` renders ``{% csrf_token %}``, worked out once per template edit"""
+    return _has_csrf_token(template_name, template_mtime(template_name))
+
+
+def cached_page(template_name):
+    """Serve plain GETs of the view from a cached render of ``template_name``
+
+    The view itself still handles anything that can't be cached (POSTs,
+    query strings, pending messages).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not is_cacheable(request):
+                return view(request, *args, **kwargs)
+
+            cache = page_cache()
+            key = page_key(request, template_name)
+            entry = cache.get(key)
+            if entry is None:
+                response = render(request, template_name, {'csrf_token': CSRF_PLACEHOLDER})
+                content = response.content.decode(response.charset)
+                # Pages with a token are finished per request, so only the
+                # others can keep precompressed copies
+                entry = content if CSRF_PLACEHOLDER in content else compressed_variants(response.content)
+                cache.set(key, entry, settings.PAGE_CACHE_TIMEOUT)
+
+            if isinstance(entry, str):
+                response = HttpResponse(entry.replace(CSRF_PLACEHOLDER, get_token(request)))
+                patch_cache_control(response, private=True)
+                patch_vary_headers(response, ('Cookie',))
+                return response
+            return variant_response(request, entry)
+
+        # Pending messages must be shown, so only plain GETs get validators,
+        # and only on pages without a per-visitor token
+        def has_validators(request):
+            return is_cacheable(request) and not has_csrf_token(template_name)
+
+        def etag(request, *args, **kwargs):
+            if has_validators(request):
+                return f'W/"{template_version(template_name)}"'
+
+        def last_modified(request, *args, **kwargs):
+            if has_validators(request):
+                return datetime.fromtimestamp(max(page_mtimes(template_name)), tz=timezone.utc)
+
+        return condition(etag_func=etag, last_modified_func=last_modified)(wrapper)
+    return decorator
@@ -0,0 +1 @@
+"""Helpers shared by the news scraping management commands."""
@@ -0,0 +1,65 @@
+"""Conditional-request cache for scraped listing pages.
+
+The ETag/Last-Modified validators and a digest of the body are kept per URL
+in ``CachedPage``, so a page that answers 304 or comes back byte-identical
+can be skipped without parsing it again.
+"""
+import hashlib
+
+from website.models import CachedPage
+
+
+def body_digest(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+class ConditionalCache:
+    """Validators for a set of URLs, loaded from the database in one query"""
+
+    def __init__(self, entries=None):
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, urls):
+        pages = CachedPage.objects.filter(url__in=list(urls))
+        return cls({page.url: page for page in pages})
+
+    def request_headers(self, url):
+        """Conditional request headers for ``url``, if we have seen it before"""
+        page = self.entries.get(url)
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers['If-None-Match'] = page.etag
+            if page.last_modified:
+                headers['If-Modified-Since'] = page.last_modified
+        return headers
+
+    def check(self, result):
+        """Flag ``result.unchanged`` when the page is the one we parsed last time"""
+        if not result.ok:
+            return result
+        page = self.entries.get(result.url)
+        if result.response.status_code == 304:
+            result.unchanged = page is not None
+        elif result.streamed:
+            # Streamed bodies are read (and cut short) by the caller, so only
+            # the HTTP validators can tell us nothing changed
+            result.unchanged = False
+        else:
+            result.body_hash = body_digest(result.response.content)
+            result.unchanged = page is not None and page.body_hash == result.body_hash
+        return result
+
+    def store(self, result):
+        """Remember the validators of a page once it has been processed"""
+        if not result.ok:
+            return
+        response = result.response
+        page = self.entries.get(result.url) or CachedPage(url=result.url)
+        page.etag = response.headers.get('ETag', page.etag)
+        page.last_modified = response.headers.get('Last-Modified', page.last_modified)
+        if result.body_hash:
+            page.body_hash = result.body_hash
+        page.save()
+        self.entries[result.url] = page
@@ -0,0 +1,107 @@
+"""Cross-source near-duplicate detection for news articles.
+
+Each title is reduced to a 64-bit SimHash stored on ``NewsArticle.fingerprint``.
+Titles that differ by a few words land within a small Hamming distance of
+each other. Recent fingerprints are held in a banded index: the hash is cut
+into ``bands`` equal slices and two fingerprints within ``max_distance``
+bits must agree exactly on at least one slice (``max_distance < bands``),
+so a lookup only compares against articles sharing a slice instead of
+scanning the table.
+"""
+import hashlib
+import re
+from datetime import timedelta
+
+from django.utils import timezone
+
+from website.models import NewsArticle
+
+WORD = re.compile(r'\w+')
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or says '
+    'that the this to was were will with after over new'.split()
+)
+FINGERPRINT_BITS = 64
+DEFAULT_BANDS = 8
+DEFAULT_MAX_DISTANCE = 6
+DEFAULT_WINDOW_DAYS = 7
+
+
+def _features(text):
+    words = [word for word in WORD.findall(text.lower()) if word not in STOPWORDS]
+    return words + [f'{first} {second}' for first, second in zip(words, words[1:])]
+
+
+def simhash(text):
+    """64-bit SimHash of ``text`` as an unsigned int"""
+    weights = [0] * FINGERPRINT_BITS
+    for feature in _features(text):
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big')
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def to_signed(fingerprint):
+    """Fit an unsigned 64-bit fingerprint into a BigIntegerField"""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(fingerprint):
+    return fingerprint & ((1 << 64) - 1)
+
+
+def title_fingerprint(title):
+    """Signed SimHash of an article title, as stored on ``NewsArticle``"""
+    return to_signed(simhash(title))
+
+
+class NearDuplicateIndex:
+    """Banded lookup of fingerprints by Hamming distance"""
+
+    def __init__(self, bands=DEFAULT_BANDS, max_distance=DEFAULT_MAX_DISTANCE):
+        if max_distance >= bands:
+            raise ValueError('max_distance must be smaller than bands')
+        self.bands = bands
+        self.max_distance = max_distance
+        self.band_bits = FINGERPRINT_BITS // bands
+        self._mask = (1 << self.band_bits) - 1
+        self._buckets = [{} for _ in range(bands)]
+
+    def _slices(self, fingerprint):
+        fingerprint = to_unsigned(fingerprint)
+        return [fingerprint >> (band * self.band_bits) & self._mask for band in range(self.bands)]
+
+    def add(self, key, fingerprint):
+        entry = (key, to_unsigned(fingerprint))
+        for buckets, value in zip(self._buckets, self._slices(fingerprint)):
+            buckets.setdefault(value, []).append(entry)
+
+    def find(self, fingerprint):
+        """Key of the closest indexed fingerprint within ``max_distance``, or None"""
+        fingerprint = to_unsigned(fingerprint)
+        best_key, best_distance = None, self.max_distance + 1
+        for buckets, value in zip(self._buckets, self._slices(fingerprint)):
+            for key, candidate in buckets.get(value, ()):
+                distance = (fingerprint ^ candidate).bit_count()
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+        return best_key
+
+    @classmethod
+    def recent(cls, days=DEFAULT_WINDOW_DAYS, **kwargs):
+        """Index of the active articles scraped in the last ``days`` days"""
+        index = cls(**kwargs)
+        rows = NewsArticle.objects.filter(
+            is_active=True,
+            duplicate_of__isnull=True,
+            fingerprint__isnull=False,
+            scraped_date__gte=timezone.now() - timedelta(days=days),
+        ).values_list('id', 'fingerprint')
+        for pk, fingerprint in rows:
+            index.add(pk, fingerprint)
+        return index
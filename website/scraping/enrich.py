@@ -0,0 +1,153 @@
+"""Optional second stage: read real publish dates and summaries from article pages.
+
+Listing pages carry no reliable dates, so new articles are stamped with the
+scrape time. The enricher fetches each new article's detail page through a
+bounded worker pool, limited per host by a token bucket, and reads
+``datePublished``/``description`` from JSON-LD or the usual meta tags.
+"""
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from website.scraping.fetch import HostRateLimiter, fetch
+from website.scraping.parsers import DEFAULT_BACKEND
+
+DATE_META = (
+    ('property', 'article:published_time'),
+    ('itemprop', 'datePublished'),
+    ('name', 'pubdate'),
+    ('name', 'publishdate'),
+    ('name', 'parsely-pub-date'),
+    ('name', 'date'),
+)
+DESCRIPTION_META = (
+    ('property', 'og:description'),
+    ('name', 'description'),
+    ('name', 'twitter:description'),
+)
+METADATA_STRAINER = SoupStrainer(['meta', 'script', 'time'])
+
+
+@dataclass(frozen=True)
+class ArticleMetadata:
+    published: Optional[datetime] = None
+    summary: str = ''
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(value.strip())
+    except ValueError:
+        return None
+    if parsed is None:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    # Ignore obviously wrong (future) dates rather than reorder the feed with them
+    if parsed > timezone.now() + timedelta(days=1):
+        return None
+    return parsed
+
+
+def _json_ld_objects(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_objects(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _json_ld_objects(data.get('@graph', []))
+
+
+def extract_metadata(content, backend=None):
+    """Read the publish date and description from an article page"""
+    soup = BeautifulSoup(content, backend or DEFAULT_BACKEND, parse_only=METADATA_STRAINER)
+    published = None
+    summary = ''
+
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for obj in _json_ld_objects(data):
+            published = published or _parse_date(obj.get('datePublished'))
+            if not summary and isinstance(obj.get('description'), str):
+                summary = obj['description'].strip()
+
+    if published is None:
+        for attr, value in DATE_META:
+            meta = soup.find('meta', attrs={attr: value})
+            published = meta and _parse_date(meta.get('content'))
+            if published:
+                break
+    if published is None:
+        time_elem = soup.find('time', datetime=True)
+        published = time_elem and _parse_date(time_elem['datetime'])
+
+    if not summary:
+        for attr, value in DESCRIPTION_META:
+            meta = soup.find('meta', attrs={attr: value})
+            if meta and meta.get('content', '').strip():
+                summary = meta['content'].strip()
+                break
+
+    return ArticleMetadata(published=published or None, summary=summary)
+
+
+class ArticleEnricher:
+    """Fills in ``published_date`` and ``summary`` of unsaved articles from their pages.
+
+    Metadata is cached by URL (up to ``cache_size`` entries), so in daemon
+    mode an article page is only ever downloaded once.
+    """
+
+    def __init__(self, pool, rate=1.0, burst=2, max_workers=4, timeout=10, cache_size=4096):
+        self.pool = pool
+        self.limiter = HostRateLimiter(rate, burst)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def _fetch_metadata(self, url):
+        self.limiter.acquire(url)
+        result = fetch(url, self.pool, self.timeout)
+        if not result.ok:
+            return ArticleMetadata()
+        return extract_metadata(result.response.content)
+
+    def _remember(self, url, metadata):
+        self._cache[url] = metadata
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def enrich(self, articles):
+        """Update ``articles`` in place and return them"""
+        urls = list(dict.fromkeys(article.url for article in articles if article.url not in self._cache))
+        if urls:
+            workers = max(1, min(self.max_workers, len(urls)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape-detail') as executor:
+                for url, metadata in zip(urls, executor.map(self._fetch_metadata, urls)):
+                    self._remember(url, metadata)
+
+        for article in articles:
+            metadata = self._cache.get(article.url)
+            if metadata is None:
+                continue
+            if metadata.published:
+                article.published_date = metadata.published
+            if metadata.summary and (
+                article.summary == article.title[:200] + "..." or len(metadata.summary) > len(article.summary)
+            ):
+                article.summary = metadata.summary[:500]
+        return articles
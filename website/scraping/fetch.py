@@ -0,0 +1,177 @@
+"""Concurrent HTTP fetch stage for the news scraper.
+
+Every source's listing page is downloaded in a bounded thread pool through
+one keep-alive session per host, so a run takes roughly as long as the
+slowest source instead of the sum of all of them.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class SessionPool:
+    """Hands out one pooled ``requests.Session`` per host.
+
+    Sessions are created lazily and kept open, so repeated requests to the
+    same site reuse the TCP/TLS connection.
+    """
+
+    def __init__(self, pool_maxsize=4):
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """Return the session for the host of ``url``"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+            return session
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = USER_AGENT
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TokenBucket:
+    """Blocking token-bucket rate limiter: ``rate`` requests/second, bursts of ``capacity``"""
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class HostRateLimiter:
+    """One ``TokenBucket`` per host, so politeness limits apply site by site"""
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity, self.clock, self.sleep)
+        bucket.acquire()
+
+
+class FetchResult:
+    """Outcome of fetching one URL: either a response or the error raised."""
+
+    def __init__(self, url, response=None, error=None, elapsed=0.0):
+        self.url = url
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+        self.streamed = False
+        # Filled in by ConditionalCache.check()
+        self.body_hash = ''
+        self.unchanged = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def raise_for_error(self):
+        if self.error is not None:
+            raise self.error
+
+
+def fetch(url, pool, timeout=10, headers=None, stream=False):
+    """Fetch ``url`` through ``pool``, capturing any error in the result
+
+    With ``stream`` only the headers are read; the body is left for the
+    caller to consume incrementally (and to stop reading early).
+    """
+    started = time.perf_counter()
+    try:
+        response = pool.get(url).get(url, headers=headers, timeout=timeout, stream=stream)
+        response.raise_for_status()
+    except Exception as e:
+        return FetchResult(url, error=e, elapsed=time.perf_counter() - started)
+    result = FetchResult(url, response=response, elapsed=time.perf_counter() - started)
+    result.streamed = stream
+    return result
+
+
+def fetch_sources(sources, pool, max_workers=DEFAULT_MAX_WORKERS, cache=None):
+    """Fetch the listing page of every source concurrently.
+
+    Returns a dict mapping each source key to its ``FetchResult``. Each
+    source is bounded by its own ``timeout``. When a ``ConditionalCache`` is
+    given, requests are made conditional and results are checked against it
+    once they are all back (so the database is only touched from this thread).
+    """
+    sources = list(sources)
+    if not sources:
+        return {}
+
+    workers = max(1, min(max_workers, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape-fetch') as executor:
+        futures = {
+            source.key: executor.submit(
+                fetch, source.url, pool, source.timeout,
+                cache.request_headers(source.url) if cache is not None else None,
+                source.kind == 'feed',
+            )
+            for source in sources
+        }
+        results = {key: future.result() for key, future in futures.items()}
+
+    if cache is not None:
+        for result in results.values():
+            cache.check(result)
+    return results
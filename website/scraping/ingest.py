@@ -0,0 +1,34 @@
+"""Batched storage of scraped articles."""
+from django.db import transaction
+
+from website.models import NewsArticle
+
+
+def unseen_articles(source, articles):
+    """Drop repeats within ``articles`` and any already stored for ``source``"""
+    batch = {}
+    for article in articles:
+        batch.setdefault(article.title, article)
+    if not batch:
+        return []
+
+    existing = set(
+        NewsArticle.objects.filter(source=source, title__in=list(batch))
+        .values_list('title', flat=True)
+    )
+    return [article for title, article in batch.items() if title not in existing]
+
+
+def ingest_articles(source, articles):
+    """Store one source's parsed articles in a single transaction.
+
+    ``articles`` are unsaved ``NewsArticle`` instances. Rows that clash with
+    the ``(title, source)`` unique constraint are skipped by the database, so
+    the whole batch costs one existence query, one multi-row insert and one
+    commit. Returns the articles that were actually new.
+    """
+    with transaction.atomic():
+        new_articles = unseen_articles(source, articles)
+        if new_articles:
+            NewsArticle.objects.bulk_create(new_articles, ignore_conflicts=True)
+    return new_articles
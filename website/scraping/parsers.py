@@ -0,0 +1,122 @@
+"""Listing page parsers for the news sources.
+
+Each source's extraction rules are compiled once at import time. Pages are
+parsed with lxml when it is installed, and only the article containers are
+built into a tree (via ``SoupStrainer``) instead of the whole document.
+"""
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from website.scraping.sources import MYBROADBAND, NEWS24
+
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    DEFAULT_BACKEND = 'html.parser'
+else:
+    DEFAULT_BACKEND = 'lxml'
+
+TITLE_TAGS = ['h1', 'h2', 'h3']
+
+
+@dataclass(frozen=True)
+class ParsedArticle:
+    title: str
+    url: str
+    summary: str
+    # Only known when the source provides them (feeds)
+    published: Optional[datetime] = None
+    guid: str = ''
+
+
+class ListingParser:
+    """Extracts article title, link and summary from a source's listing page.
+
+    ``container_class``, ``title_class`` and ``summary_class`` are matched
+    case-insensitively against each CSS class of an element, which is what
+    the original ``class_=lambda x: ...`` filters did.
+    """
+
+    def __init__(self, source, container_tags, container_class, title_class=None,
+                 title_falls_back_to_link=False, link_falls_back_to_container=False,
+                 summary_class=r'summary|excerpt', backend=None):
+        self.source = source
+        self.container_tags = list(container_tags)
+        self.container_class = re.compile(container_class, re.IGNORECASE)
+        self.title_class = re.compile(title_class, re.IGNORECASE) if title_class else None
+        self.title_falls_back_to_link = title_falls_back_to_link
+        self.link_falls_back_to_container = link_falls_back_to_container
+        self.summary_class = re.compile(summary_class, re.IGNORECASE)
+        self.backend = backend or DEFAULT_BACKEND
+        self.strainer = SoupStrainer(self.container_tags, class_=self.container_class)
+
+    def containers(self, content, max_articles):
+        """Return the first ``max_articles`` article containers on the page"""
+        if max_articles <= 0:
+            return []
+        soup = BeautifulSoup(content, self.backend, parse_only=self.strainer)
+        return soup.find_all(self.container_tags, class_=self.container_class, limit=max_articles)
+
+    def extract(self, container):
+        """Build a ``ParsedArticle`` from one container, or None if it has no usable link"""
+        if self.title_class is not None:
+            title_elem = container.find(TITLE_TAGS, class_=self.title_class)
+        else:
+            title_elem = container.find(TITLE_TAGS)
+        if not title_elem and self.title_falls_back_to_link:
+            title_elem = container.find('a')
+        if not title_elem:
+            return None
+
+        title = title_elem.get_text(strip=True)
+        link_elem = title_elem if title_elem.name == 'a' else title_elem.find('a')
+        if not link_elem and self.link_falls_back_to_container:
+            link_elem = container.find('a')
+        if not link_elem or not link_elem.get('href'):
+            return None
+
+        summary_elem = container.find('p', class_=self.summary_class) or container.find('p')
+        summary = summary_elem.get_text(strip=True)[:500] if summary_elem else title[:200] + "..."
+
+        return ParsedArticle(
+            title=title,
+            url=self.source.absolute_url(link_elem['href']),
+            summary=summary,
+        )
+
+    def parse(self, content, max_articles):
+        """Extract every usable article from a listing page"""
+        articles = []
+        for container in self.containers(content, max_articles):
+            article = self.extract(container)
+            if article is not None:
+                articles.append(article)
+        return articles
+
+
+def build_parsers(backend=None):
+    """Parsers for every built-in source, keyed by source key"""
+    return {
+        NEWS24.key: ListingParser(
+            NEWS24,
+            container_tags=['article'],
+            container_class='article',
+            title_class='title',
+            title_falls_back_to_link=True,
+            backend=backend,
+        ),
+        MYBROADBAND.key: ListingParser(
+            MYBROADBAND,
+            container_tags=['article', 'div'],
+            container_class='post|article',
+            link_falls_back_to_container=True,
+            backend=backend,
+        ),
+    }
+
+
+PARSERS = build_parsers()
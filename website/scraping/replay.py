@@ -0,0 +1,117 @@
+"""Offline record/replay of scraper HTTP traffic.
+
+``RecordingPool`` saves every response fetched through it (body and headers)
+into a ``FixtureArchive`` directory. ``ReplayPool`` serves those fixtures back
+through a requests transport adapter, so ``scrape_news`` and the benchmark
+run without touching the live sites.
+"""
+import hashlib
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from website.scraping.fetch import SessionPool
+
+# The archive stores decoded bodies, so these no longer describe them
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class FixtureArchive:
+    """A directory of recorded responses, one ``.json``/``.body`` pair per URL"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode()).hexdigest()[:20]
+
+    def save(self, url, status, headers, content):
+        self.path.mkdir(parents=True, exist_ok=True)
+        key = self._key(url)
+        headers = {
+            name: value for name, value in headers.items()
+            if name.lower() not in DROPPED_HEADERS
+        }
+        (self.path / f'{key}.body').write_bytes(content)
+        (self.path / f'{key}.json').write_text(
+            json.dumps({'url': url, 'status': status, 'headers': headers}, indent=2)
+        )
+
+    def save_response(self, response, *args, **kwargs):
+        """requests response hook that records ``response``"""
+        self.save(response.url, response.status_code, response.headers, response.content)
+        return response
+
+    def load(self, url):
+        """Return ``(status, headers, content)`` for ``url``, or None if not recorded"""
+        key = self._key(url)
+        meta_path = self.path / f'{key}.json'
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text())
+        return meta['status'], meta['headers'], (self.path / f'{key}.body').read_bytes()
+
+    def urls(self):
+        return sorted(json.loads(path.read_text())['url'] for path in self.path.glob('*.json'))
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering requests from a ``FixtureArchive``"""
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        fixture = self.archive.load(request.url)
+        if fixture is None:
+            raise requests.ConnectionError(f'No recorded response for {request.url}', request=request)
+        status, headers, content = fixture
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        # Lets iter_content() stream the recorded body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ''
+        return response
+
+    def close(self):
+        pass
+
+
+class RecordingPool(SessionPool):
+    """``SessionPool`` whose sessions save every response into ``archive``"""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def _create_session(self):
+        session = super()._create_session()
+        session.hooks['response'].append(self.archive.save_response)
+        return session
+
+
+class ReplayPool(SessionPool):
+    """``SessionPool`` whose sessions never leave the machine"""
+
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def _create_session(self):
+        session = super()._create_session()
+        adapter = ReplayAdapter(self.archive)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
@@ -0,0 +1,65 @@
+"""Per-source scheduling for the resident ``scrape_news --daemon`` mode.
+
+Each source runs on its own interval. A failing source backs off
+exponentially (up to ``max_backoff``) without delaying the others, and every
+delay is jittered so sources don't fire in lockstep.
+"""
+import random
+import time
+
+DEFAULT_JITTER = 0.1
+DEFAULT_MAX_BACKOFF = 6 * 60 * 60
+# Far past any sensible max_backoff, and small enough that a float interval
+# can't overflow however long a source keeps failing
+MAX_BACKOFF_DOUBLINGS = 32
+
+
+class SourceSchedule:
+    """When a single source should next be scraped"""
+
+    def __init__(self, source, interval, next_run):
+        self.source = source
+        self.interval = interval
+        self.next_run = next_run
+        self.failures = 0
+
+
+class Scheduler:
+    def __init__(self, sources, interval=None, max_backoff=DEFAULT_MAX_BACKOFF,
+                 jitter=DEFAULT_JITTER, clock=time.monotonic, rng=None):
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.clock = clock
+        self.rng = rng or random.Random()
+        now = self.clock()
+        self.schedules = {
+            source.key: SourceSchedule(source, interval or source.interval, now)
+            for source in sources
+        }
+
+    def _jittered(self, delay):
+        return delay * self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def due(self, now=None):
+        """Schedules whose next run time has passed"""
+        now = self.clock() if now is None else now
+        return [schedule for schedule in self.schedules.values() if schedule.next_run <= now]
+
+    def seconds_until_next(self, now=None):
+        now = self.clock() if now is None else now
+        next_run = min(schedule.next_run for schedule in self.schedules.values())
+        return max(0.0, next_run - now)
+
+    def record(self, key, ok, now=None):
+        """Reschedule a source after a run; returns the delay until its next run"""
+        now = self.clock() if now is None else now
+        schedule = self.schedules[key]
+        if ok:
+            schedule.failures = 0
+            delay = schedule.interval
+        else:
+            schedule.failures += 1
+            delay = min(self.max_backoff, schedule.interval * 2 ** min(schedule.failures, MAX_BACKOFF_DOUBLINGS))
+        delay = self._jittered(delay)
+        schedule.next_run = now + delay
+        return delay
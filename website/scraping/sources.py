@@ -0,0 +1,45 @@
+"""News sources scraped by the ``scrape_news`` command."""
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class NewsSource:
+    """A news site listing page, how long we wait for it and how often we scrape it."""
+
+    key: str
+    name: str
+    url: str
+    base_url: str
+    timeout: float = 10
+    interval: float = 15 * 60
+    # 'html' listing page, or 'feed' for RSS/Atom
+    kind: str = 'html'
+
+    def absolute_url(self, href):
+        """Resolve a (possibly relative) article link against the site root"""
+        if href.startswith('http'):
+            return href
+        return self.base_url + href
+
+
+NEWS24 = NewsSource(
+    key='news24',
+    name='News24',
+    url='https://www.news24.com/tags/topics/it',
+    base_url='https://www.news24.com',
+)
+
+MYBROADBAND = NewsSource(
+    key='mybroadband',
+    name='MyBroadband',
+    url='https://mybroadband.co.za/news',
+    base_url='https://mybroadband.co.za',
+)
+
+SOURCES = {source.key: source for source in (NEWS24, MYBROADBAND)}
+
+# RSS/Atom alternatives to the listing pages, used with ``scrape_news --feeds``.
+# Articles are stored under the same source key either way.
+MYBROADBAND_FEED = replace(MYBROADBAND, url='https://mybroadband.co.za/news/feed', kind='feed')
+
+FEEDS = {source.key: source for source in (MYBROADBAND_FEED,)}
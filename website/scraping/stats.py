@@ -0,0 +1,16 @@
+"""Timing and volume counters for one source in one scrape run."""
+from dataclasses import dataclass
+
+
+@dataclass
+class SourceStats:
+    source: str
+    fetch_ms: float = 0.0
+    bytes_downloaded: int = 0
+    parse_ms: float = 0.0
+    db_ms: float = 0.0
+    articles_seen: int = 0
+    articles_new: int = 0
+    articles_duplicate: int = 0
+    unchanged: bool = False
+    errors: int = 0
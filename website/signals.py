@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import NewsArticle
+from .news_cache import bump_generation
+
+
+@receiver(post_save, sender=NewsArticle)
+@receiver(post_delete, sender=NewsArticle)
+def invalidate_news_page(sender, using, **kwargs):
+    """Admin edits and manual entries change the news page too
+
+    The bump waits for the write to commit: until then other connections
+    still read the old rows, and would cache them under the new generation.
+    A transaction that changes many articles (the scraper's cleanup) bumps
+    once.
+    """
+    connection = transaction.get_connection(using)
+    if not any(func is bump_generation for _, func, _ in connection.run_on_commit):
+        transaction.on_commit(bump_generation, using=using)
@@ -291,6 +291,12 @@ document.addEventListener('DOMContentLoaded', function() {
         initNews();
     }
 
+    // "N minutes ago" labels are rendered here so the news HTML stays cacheable
+    if (document.querySelector('time[data-relative]')) {
+        updateRelativeTimes();
+        setInterval(updateRelativeTimes, 60000);
+    }
+
     // Circuit board divider scroll animation
     initCircuitAnimation();
 
@@ -439,6 +445,36 @@ function initNews() {
     loadNewsFeeds();
 }
 
+// Relative publish times, same wording as NewsArticle.time_since_published
+function timeSince(date) {
+    const seconds = Math.max(0, Math.floor((Date.now() - date.getTime()) / 1000));
+    const days = Math.floor(seconds / 86400);
+    const hours = Math.floor((seconds % 86400) / 3600);
+    const minutes = Math.floor((seconds % 3600) / 60);
+    const plural = (count, unit) => `${count} ${unit}${count !== 1 ? 's' : ''} ago`;
+
+    if (days > 0) {
+        return plural(days, 'day');
+    } else if (hours > 0) {
+        return plural(hours, 'hour');
+    }
+    return plural(minutes, 'minute');
+}
+
+function updateRelativeTimes() {
+    document.querySelectorAll('time[data-relative]').forEach(el => {
+        const date = new Date(el.getAttribute('datetime'));
+        if (isNaN(date)) {
+            return;
+        }
+        if (!el.title) {
+            // Keep the absolute date the server rendered as a tooltip
+            el.title = el.textContent;
+        }
+        el.textContent = timeSince(date);
+    });
+}
+
 // Placeholder function for loading news feeds
 // In production, this would make API calls to Facebook, News24, etc.
 function loadNewsFeeds() {
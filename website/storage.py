@@ -0,0 +1,16 @@
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+
+class ManifestStorage(ManifestStaticFilesStorage):
+    """Content-hashed static files that tolerate links to uncollected files
+
+    Some pages reference media that is copied to the server by hand (team
+    photos, videos) rather than shipped in ``website/static``. Those get
+    their plain name instead of failing the whole page.
+    """
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
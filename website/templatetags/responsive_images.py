@@ -0,0 +1,89 @@
+"""Template tags serving each device the smallest adequate image.
+
+Both read the variants ``manage.py optimize_media`` recorded in
+``RESPONSIVE_IMAGES_MANIFEST`` and fall back to the plain image for files the
+manifest doesn't list.
+"""
+from django import template
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from website.media.manifest import load_manifest
+
+register = template.Library()
+
+# <source> elements in preference order; the JPEG variants go on the <img>
+SOURCE_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+
+
+def srcset(variants):
+    return ', '.join(f'{static(path)} {width}w' for width, path in variants)
+
+
+@register.simple_tag
+def responsive_image(path, alt='', sizes='100vw', **attrs):
+    """``<picture>`` with AVIF/WebP sources and a JPEG ``<img>``, all as srcsets
+
+    Extra keyword arguments become attributes of the ``<img>``, with
+    underscores turned into dashes: ``loading="lazy" data_id="3"``.
+    """
+    attrs = {name.replace('_', '-'): value for name, value in attrs.items()}
+    entry = load_manifest().get(path)
+    if entry is None:
+        return format_html('<img src="{}" alt="{}"{}>', static(path), alt, flatatt(attrs))
+
+    sources = entry['sources']
+    fallback = sources['jpeg']
+    img = format_html(
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" alt="{}"{}>',
+        static(fallback[-1][1]), srcset(fallback), sizes, entry['width'], entry['height'], alt, flatatt(attrs),
+    )
+    return format_html(
+        '<picture>{}{}</picture>',
+        format_html_join('', '<source type="{}" srcset="{}" sizes="{}">', (
+            (mime, srcset(sources[fmt]), sizes) for fmt, mime in SOURCE_TYPES.items() if fmt in sources
+        )),
+        img,
+    )
+
+
+def background(overlay, image):
+    layers = f'{overlay}, {image}' if overlay else image
+    return f'background: {layers} !important;'
+
+
+def css_url(path):
+    return f"url('{static(path)}')"
+
+
+@register.simple_tag
+def responsive_background(selector, path, overlay=''):
+    """CSS giving ``selector`` the background ``path``, sized to the viewport
+
+    The smallest variant is the default and each wider one takes over above
+    the previous width, with ``image-set()`` picking AVIF or WebP where the
+    browser supports them. ``overlay`` is drawn on top, e.g. a gradient.
+    """
+    entry = load_manifest().get(path)
+    if entry is None:
+        return mark_safe(f'{selector} {{ {background(overlay, css_url(path))} }}')
+
+    sources = entry['sources']
+    rules = []
+    previous = None
+    for index, (width, jpeg) in enumerate(sources['jpeg']):
+        candidates = [
+            f'{css_url(sources[fmt][index][1])} type("{mime}")'
+            for fmt, mime in SOURCE_TYPES.items() if fmt in sources
+        ]
+        candidates.append(f'{css_url(jpeg)} type("image/jpeg")')
+        image_set = 'image-set(' + ', '.join(candidates) + ')'
+        # Browsers without image-set() keep the plain url() declaration
+        rule = f'{selector} {{ {background(overlay, css_url(jpeg))} {background(overlay, image_set)} }}'
+        if previous is not None:
+            rule = f'@media (min-width: {previous + 1}px) {{ {rule} }}'
+        rules.append(rule)
+        previous = width
+    return mark_safe('\n'.join(rules))
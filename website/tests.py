@@ -1,3 +1,975 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.db.models import Q
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+import numpy as np
+from PIL import Image
+
+from bjs_website.sqlite import enable_wal
+
+from .compression import brotli
+from .management.commands.scrape_news import Command as ScrapeCommand
+from .media.alpha import key_background
+from .models import NewsArticle, ScrapeRun
+from .news_cache import get_generation, news_cache
+from .page_cache import CSRF_PLACEHOLDER, page_cache, template_mtime, template_version
+from .scraping.classifier import KeywordClassifier
+from .scraping.enrich import ArticleEnricher, extract_metadata
+from .scraping.fetch import HostRateLimiter, TokenBucket
+from .scraping.replay import FixtureArchive, ReplayPool
+from .scraping.scheduler import DEFAULT_MAX_BACKOFF, Scheduler
+from .scraping.sources import MYBROADBAND, MYBROADBAND_FEED, NEWS24
+
+NEWS24_PAGE = b"""
+<html><body>
+  <div class="sidebar"><p>Not an article</p></div>
+  <article class="article-item">
+    <h2 class="article-title"><a href="/tech/eskom-stage-6">Eskom announces stage 6 load shedding from tonight</a></h2>
+    <p class="article-summary">The utility blamed breakdowns at several power stations.</p>
+  </article>
+  <article class="Article-Card">
+    <a href="https://www.news24.com/tech/ai-apps">New AI apps launched for small businesses</a>
+    <p>Local developers have released a range of tools.</p>
+  </article>
+</body></html>
+"""
+
+MYBROADBAND_PAGE = b"""
+<html><body>
+  <div class="post-list">
+    <div class="post">
+      <h3><a href="https://mybroadband.co.za/news/energy/1.html">Eskom announces Stage 6 load shedding tonight</a></h3>
+      <p class="excerpt">Stage 6 will run until further notice.</p>
+    </div>
+    <div class="post">
+      <h3>Vodacom switches on new fibre network</h3>
+      <a href="/news/fibre/2.html">Read more</a>
+    </div>
+  </div>
+</body></html>
+"""
+
+FEED_ITEM = """
+    <item>
+      <title>{title}</title>
+      <link>https://mybroadband.co.za/news/{slug}.html</link>
+      <guid isPermaLink="false">https://mybroadband.co.za/news/?p={guid}</guid>
+      <pubDate>{date}</pubDate>
+      <description><![CDATA[<p>{title} &amp; more.</p>]]></description>
+    </item>"""
+
+
+def rss_feed(*items):
+    body = ''.join(FEED_ITEM.format(**item) for item in items)
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>MyBroadband</title>{body}</channel></rss>'.encode()
+
+
+# Scrapes and article saves bump the news generation; keep it out of the
+# developer's file cache
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReplayTestCase(TestCase):
+    """Runs scrape_news against recorded pages instead of the live sites"""
+
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        self.archive = FixtureArchive(self.archive_dir)
+        self.archive.save(NEWS24.url, 200, {'Content-Type': 'text/html; charset=utf-8'}, NEWS24_PAGE)
+        self.archive.save(MYBROADBAND.url, 200, {'Content-Type': 'text/html; charset=utf-8'}, MYBROADBAND_PAGE)
+
+    def scrape(self, *args):
+        out = StringIO()
+        call_command('scrape_news', '--replay', self.archive_dir, *args, stdout=out)
+        return out.getvalue()
+
+
+class ScrapeReplayTestCase(ReplayTestCase):
+    def test_replay_adapter_serves_recorded_pages(self):
+        with ReplayPool(self.archive) as pool:
+            response = pool.get(NEWS24.url).get(NEWS24.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, NEWS24_PAGE)
+        self.assertEqual(response.encoding, 'utf-8')
+
+    def test_scrape_stores_articles_from_both_sources(self):
+        self.scrape()
+
+        news24 = NewsArticle.objects.filter(source='news24').order_by('title')
+        self.assertEqual(
+            [(article.title, article.url, article.category) for article in news24],
+            [
+                ('Eskom announces stage 6 load shedding from tonight',
+                 'https://www.news24.com/tech/eskom-stage-6', 'solar'),
+                ('New AI apps launched for small businesses',
+                 'https://www.news24.com/tech/ai-apps', 'ict'),
+            ],
+        )
+        fibre = NewsArticle.objects.get(source='mybroadband', title='Vodacom switches on new fibre network')
+        self.assertEqual(fibre.url, 'https://mybroadband.co.za/news/fibre/2.html')
+        self.assertEqual(fibre.summary, 'Vodacom switches on new fibre network...')
+
+    def test_near_duplicate_from_other_source_is_hidden(self):
+        self.scrape()
+
+        original = NewsArticle.objects.get(source='news24', title__startswith='Eskom')
+        duplicate = NewsArticle.objects.get(source='mybroadband', title__startswith='Eskom')
+        self.assertFalse(duplicate.is_active)
+        self.assertEqual(duplicate.duplicate_of, original)
+
+    def test_unchanged_pages_are_not_parsed_again(self):
+        self.scrape()
+        output = self.scrape()
+
+        self.assertIn('News24 unchanged since last run, skipping', output)
+        self.assertIn('MyBroadband unchanged since last run, skipping', output)
+        self.assertEqual(NewsArticle.objects.count(), 4)
+
+    def test_benchmark_leaves_database_untouched(self):
+        out = StringIO()
+        call_command('benchmark_scrape', self.archive_dir, '--iterations', '2', stdout=out)
+
+        self.assertIn('News24', out.getvalue())
+        self.assertIn('MyBroadband', out.getvalue())
+        self.assertEqual(NewsArticle.objects.count(), 0)
+
+
+class DaemonCycleTestCase(ReplayTestCase):
+    def run_cycle(self):
+        out = StringIO()
+        command = ScrapeCommand(stdout=out)
+        command.conditional_cache = None
+        command.enricher = None
+        scheduler = Scheduler([NEWS24, MYBROADBAND])
+        with ReplayPool(self.archive) as command.session_pool:
+            command.run_cycle(scheduler, scheduler.due(), {'workers': 2, 'max_articles': 10, 'export': None})
+        return out.getvalue()
+
+    def test_end_of_cycle_errors_do_not_stop_the_daemon(self):
+        with mock.patch.object(ScrapeCommand, 'record_run', side_effect=OperationalError('database is locked')):
+            output = self.run_cycle()
+
+        self.assertIn('Error finishing scrape cycle: database is locked', output)
+        self.assertEqual(NewsArticle.objects.count(), 4)
+
+
+class SchedulerTestCase(SimpleTestCase):
+    def scheduler(self, **kwargs):
+        self.now = 0.0
+        return Scheduler([NEWS24, MYBROADBAND], interval=100, clock=lambda: self.now, **kwargs)
+
+    def test_failures_back_off_exponentially_up_to_the_cap(self):
+        scheduler = self.scheduler(jitter=0, max_backoff=1000)
+
+        delays = [scheduler.record(NEWS24.key, ok=False) for _ in range(5)]
+        self.assertEqual(delays, [200, 400, 800, 1000, 1000])
+        self.assertEqual(scheduler.record(NEWS24.key, ok=True), 100)
+        self.assertEqual(scheduler.record(NEWS24.key, ok=False), 200)
+
+    def test_long_failure_streak_does_not_overflow(self):
+        scheduler = Scheduler([NEWS24], interval=300.0, jitter=0, clock=lambda: 0.0)
+
+        delays = [scheduler.record(NEWS24.key, ok=False) for _ in range(2000)]
+        self.assertEqual(delays[-1], DEFAULT_MAX_BACKOFF)
+
+    def test_failing_source_does_not_hold_up_the_others(self):
+        scheduler = self.scheduler(jitter=0)
+        scheduler.record(NEWS24.key, ok=False)
+        scheduler.record(MYBROADBAND.key, ok=True)
+
+        self.now = 100
+        self.assertEqual([schedule.source for schedule in scheduler.due()], [MYBROADBAND])
+        self.assertEqual(scheduler.seconds_until_next(), 0)
+        scheduler.record(MYBROADBAND.key, ok=True)
+        self.assertEqual(scheduler.seconds_until_next(), 100)
+
+    def test_delays_are_jittered_within_bounds(self):
+        delays = [self.scheduler(rng=random.Random(seed)).record(NEWS24.key, ok=True) for seed in range(50)]
+
+        self.assertTrue(all(90 <= delay <= 110 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertEqual(delays[7], self.scheduler(rng=random.Random(7)).record(NEWS24.key, ok=True))
+
+
+class ScrapeMetricsTestCase(ReplayTestCase):
+    def test_run_is_recorded_and_exported(self):
+        self.scrape()
+
+        run = ScrapeRun.objects.get()
+        stats = {row.source: row for row in run.sources.all()}
+        self.assertEqual(set(stats), {'news24', 'mybroadband'})
+        self.assertEqual(stats['news24'].articles_seen, 2)
+        self.assertEqual(stats['news24'].articles_new, 2)
+        self.assertEqual(stats['news24'].bytes_downloaded, len(NEWS24_PAGE))
+
+        response = self.client.get('/metrics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'bjs_scrape_articles_new{source="news24"} 2', response.content)
+        self.assertIn(b'bjs_scrape_duration_seconds', response.content)
+
+
+class FeedReplayTestCase(ReplayTestCase):
+    OLDER = {'title': 'Telkom cuts fibre prices', 'slug': 'telkom', 'guid': 1,
+             'date': 'Mon, 01 Sep 2025 08:00:00 +0200'}
+    NEWER = {'title': 'Rain launches 5G in Gqeberha', 'slug': 'rain', 'guid': 2,
+             'date': 'Tue, 02 Sep 2025 09:30:00 +0200'}
+
+    def record_feed(self, *items):
+        self.archive.save(MYBROADBAND_FEED.url, 200, {'Content-Type': 'application/rss+xml'}, rss_feed(*items))
+
+    def test_feed_items_keep_their_publish_date_and_guid(self):
+        self.record_feed(self.OLDER)
+        self.scrape('--feeds')
+
+        article = NewsArticle.objects.get(source='mybroadband')
+        self.assertEqual(article.title, 'Telkom cuts fibre prices')
+        self.assertEqual(article.url, 'https://mybroadband.co.za/news/telkom.html')
+        self.assertEqual(article.summary, 'Telkom cuts fibre prices & more.')
+        self.assertEqual(article.guid, 'https://mybroadband.co.za/news/?p=1')
+        self.assertEqual(article.published_date.isoformat(), '2025-09-01T06:00:00+00:00')
+
+    def test_feed_reading_stops_at_known_guid(self):
+        self.record_feed(self.OLDER)
+        self.scrape('--feeds')
+        self.record_feed(self.NEWER, self.OLDER)
+        output = self.scrape('--feeds')
+
+        self.assertIn('stopped at a known item after 1 new', output)
+        self.assertEqual(NewsArticle.objects.filter(source='mybroadband').count(), 2)
+
+
+class KeywordClassifierTestCase(SimpleTestCase):
+    classifier = ScrapeCommand.classifier
+
+    def test_keywords_match_whole_words_only(self):
+        # 'ai' used to match inside 'said', and 'ups' inside 'groups'
+        self.assertEqual(self.classifier.match_counts('The minister said pressure groups met'), {'solar': 0, 'ict': 0})
+        self.assertEqual(self.classifier.classify('The minister said pressure groups met'), 'ict')
+        self.assertEqual(self.classifier.match_counts('New UPS and AI tools'), {'solar': 1, 'ict': 1})
+
+    def test_phrases_and_plurals(self):
+        counts = self.classifier.match_counts('Eskom: load shedding returns as solar panels and apps sell out')
+
+        # 'solar panels' counts once, as the longer phrase, not again as 'solar'
+        self.assertEqual(counts, {'solar': 3, 'ict': 1})
+        self.assertEqual(self.classifier.match_counts('A heavy load, then shedding'), {'solar': 0, 'ict': 0})
+
+    def test_first_category_wins(self):
+        classifier = KeywordClassifier([('solar', ['inverter']), ('ict', ['cloud', 'data'])], default='other')
+
+        self.assertEqual(classifier.classify('Cloud data for every inverter'), 'solar')
+        self.assertEqual(classifier.classify_many(['cloud costs', 'nothing here']), ['ict', 'other'])
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('benchmark_classifier', '--headlines', '50', '--extra-keywords', '0', '10', stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], '50 synthetic headlines')
+        self.assertEqual(len(lines), 3)
+        self.assertIn(f'{self.classifier.keyword_count + 10:5d} keywords:', lines[2])
+
+
+class FakeClock:
+    """Monotonic clock for rate limiter tests; sleeping advances it"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTestCase(SimpleTestCase):
+    def test_bucket_allows_a_burst_then_paces_requests(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+
+    def test_limit_applies_per_host(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(rate=1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire('https://www.news24.com/a')
+        limiter.acquire('https://mybroadband.co.za/b')
+        self.assertEqual(clock.sleeps, [])
+        limiter.acquire('https://www.news24.com/c')
+        self.assertEqual(clock.sleeps, [1.0])
+
+
+class ExtractMetadataTestCase(SimpleTestCase):
+    def test_json_ld_graph(self):
+        metadata = extract_metadata(b"""<html><head>
+            <script type="application/ld+json">{"@graph": [{"@type": "WebPage"},
+              {"@type": "NewsArticle", "datePublished": "2024-05-01T08:30:00+02:00",
+               "description": " Eskom restores power. "}]}</script>
+            <meta property="article:published_time" content="2020-01-01T00:00:00Z">
+        </head></html>""")
+
+        self.assertEqual(metadata.published, datetime(2024, 5, 1, 6, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual(metadata.summary, 'Eskom restores power.')
+
+    def test_meta_tags_when_there_is_no_json_ld(self):
+        metadata = extract_metadata(b"""<html><head>
+            <script type="application/ld+json">not json</script>
+            <meta property="article:published_time" content="2024-05-01T08:30:00Z">
+            <meta property="og:description" content="Fibre prices drop.">
+            <meta name="description" content="Generic site description">
+        </head></html>""")
+
+        self.assertEqual(metadata.published, datetime(2024, 5, 1, 8, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual(metadata.summary, 'Fibre prices drop.')
+
+    def test_time_element_is_the_last_resort(self):
+        metadata = extract_metadata(b'<html><body><time datetime="2024-05-01 08:30">1 May</time></body></html>')
+
+        self.assertEqual(metadata.published, datetime(2024, 5, 1, 8, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual(metadata.summary, '')
+
+    def test_future_dates_are_ignored(self):
+        future = (timezone.now() + timedelta(days=30)).isoformat()
+        metadata = extract_metadata(f'<meta name="date" content="{future}">'.encode())
+
+        self.assertIsNone(metadata.published)
+
+
+class ArticleEnricherTestCase(SimpleTestCase):
+    URL = 'https://www.news24.com/tech/ai-apps'
+
+    def setUp(self):
+        archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_dir)
+        self.archive = FixtureArchive(archive_dir)
+        self.archive.save(self.URL, 200, {'Content-Type': 'text/html'}, b"""<html><head>
+            <meta property="article:published_time" content="2024-05-01T08:30:00Z">
+            <meta property="og:description" content="Local developers have released a range of AI tools for small businesses.">
+        </head></html>""")
+
+    def article(self):
+        title = 'New AI apps launched for small businesses'
+        return NewsArticle(title=title, url=self.URL, summary=title[:200] + '...')
+
+    def test_articles_get_dates_and_summaries_from_their_pages(self):
+        with ReplayPool(self.archive) as pool:
+            enricher = ArticleEnricher(pool, rate=100)
+            [article] = enricher.enrich([self.article()])
+
+            self.assertEqual(article.published_date, datetime(2024, 5, 1, 8, 30, tzinfo=dt_timezone.utc))
+            self.assertEqual(article.summary, 'Local developers have released a range of AI tools for small businesses.')
+
+            # Cached by URL: a second pass doesn't download the page again
+            self.archive.save(self.URL, 200, {'Content-Type': 'text/html'}, b'<html></html>')
+            [again] = enricher.enrich([self.article()])
+        self.assertEqual(again.published_date, article.published_date)
+
+
+class NewsQueryPlanTestCase(TestCase):
+    """The news page queries must be answered from the listing index, not a table sort"""
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_category_listing_uses_index(self):
+        queryset = NewsArticle.objects.filter(category='ict', is_active=True).order_by('-published_date')[:10]
+        self.assertUsesIndex(queryset, 'news_category_listing_idx')
+
+    def test_category_count_uses_index(self):
+        queryset = NewsArticle.objects.filter(category='solar', is_active=True)
+        self.assertIn('news_category_listing_idx', queryset.explain())
+
+    def test_cleanup_uses_scraped_date_index(self):
+        queryset = NewsArticle.objects.filter(scraped_date__lt=timezone.now())
+        self.assertIn('news_scraped_date_idx', queryset.explain())
+
+
+class SqlitePragmaTestCase(SimpleTestCase):
+    def setUp(self):
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir)
+        self.connection = DatabaseWrapper(
+            {**connections['default'].settings_dict, 'NAME': Path(workdir) / 'db.sqlite3'}, alias='pragma-test',
+        )
+        self.addCleanup(self.connection.close)
+
+    def pragma(self, name):
+        with self.connection.cursor() as cursor:
+            return cursor.execute(f'PRAGMA {name}').fetchone()[0]
+
+    def test_connections_are_tuned_without_changing_the_journal_mode(self):
+        self.assertEqual(self.pragma('busy_timeout'), 5000)
+        self.assertEqual(self.pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self.pragma('journal_mode'), 'delete')
+
+    def test_enable_wal(self):
+        connections['pragma-test'] = self.connection
+        self.addCleanup(delattr, connections._connections, 'pragma-test')
+
+        self.assertEqual(enable_wal('pragma-test'), 'wal')
+        self.assertEqual(self.pragma('journal_mode'), 'wal')
+
+
+@override_settings(READ_DATABASE='default')
+class NewsPageCacheTestCase(ReplayTestCase):
+    def setUp(self):
+        super().setUp()
+        news_cache().clear()
+
+    def test_page_is_served_from_cache_until_the_generation_changes(self):
+        self.client.get('/news/')
+        with self.assertNumQueries(0):
+            self.assertNotIn(b'New AI apps', self.client.get('/news/').content)
+
+        self.scrape()
+        self.assertIn(b'New AI apps', self.client.get('/news/').content)
+
+    def test_article_edit_invalidates_page(self):
+        self.scrape()
+        self.client.get('/news/')
+
+        article = NewsArticle.objects.get(title__startswith='New AI apps')
+        article.title = 'Corrected headline'
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        self.assertIn(b'Corrected headline', self.client.get('/news/').content)
+
+    def test_repeat_visit_gets_304_until_next_scrape(self):
+        self.scrape()
+        response = self.client.get('/news/')
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/news/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            NewsArticle.objects.first().save()
+        self.assertEqual(self.client.get('/news/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def assertChangeIsModified(self, change):
+        self.scrape()
+        last_modified = self.client.get('/news/')['Last-Modified']
+        self.assertEqual(self.client.get('/news/', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        article = NewsArticle.objects.get(title__startswith='New AI apps')
+        change(article)
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save()
+        response = self.client.get('/news/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_if_modified_since_sees_edits(self):
+        response = self.assertChangeIsModified(lambda article: setattr(article, 'title', 'Corrected headline'))
+        self.assertIn(b'Corrected headline', response.content)
+
+    def test_if_modified_since_sees_deactivations(self):
+        response = self.assertChangeIsModified(lambda article: setattr(article, 'is_active', False))
+        self.assertNotIn(b'New AI apps', response.content)
+
+    def test_changes_bump_once_after_commit(self):
+        self.scrape()
+        generation = get_generation()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            NewsArticle.objects.all().delete()
+            # Until the commit, other connections still see the old articles
+            self.assertEqual(get_generation(), generation)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(get_generation(), generation + 1)
+
+    def test_page_is_identical_between_scrapes(self):
+        self.scrape()
+        first = self.client.get('/news/').content
+        news_cache().clear()
+
+        self.assertEqual(self.client.get('/news/').content, first)
+        self.assertIn(b'<time datetime="', first)
+        self.assertNotIn(b' ago<', first)
+
+
+@override_settings(READ_DATABASE='default')
+class ExportSiteTestCase(ReplayTestCase):
+    def setUp(self):
+        super().setUp()
+        news_cache().clear()
+        page_cache().clear()
+        self.output = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output)
+
+    def export(self, *args):
+        call_command('export_site', '--output', str(self.output), *args, stdout=StringIO())
+
+    def test_exports_pages_and_static_files(self):
+        self.export('--static-url', 'https://cdn.example.com/static/')
+
+        team = (self.output / 'team' / 'index.html').read_text()
+        self.assertIn('href="https://cdn.example.com/static/website/css/styles.css"', team)
+        self.assertNotIn('"/static/', team)
+        self.assertTrue((self.output / 'static' / 'website' / 'js' / 'main.js').is_file())
+        # Pages with a CSRF form are left to Django
+        self.assertFalse((self.output / 'index.html').exists())
+        self.assertFalse((self.output / 'contact' / 'index.html').exists())
+        # The JSON API and metrics aren't pages
+        self.assertFalse((self.output / 'api').exists())
+        self.assertFalse((self.output / 'metrics').exists())
+
+    def test_only_accepts_html_pages(self):
+        with self.assertRaisesMessage(CommandError, 'Not an HTML page: news_api'):
+            self.export('--only', 'news', 'news_api')
+
+    def test_scrape_re_exports_news_page(self):
+        self.export()
+        self.assertNotIn('New AI apps', (self.output / 'news' / 'index.html').read_text())
+
+        self.scrape('--export', str(self.output))
+        self.assertIn('New AI apps', (self.output / 'news' / 'index.html').read_text())
+
+    def test_cleanup_alone_re_exports_news_page(self):
+        self.scrape('--export', str(self.output))
+        NewsArticle.objects.update(scraped_date=timezone.now() - timedelta(days=31))
+
+        self.assertIn('Cleaned up 4 old articles', self.scrape('--export', str(self.output)))
+        self.assertNotIn('New AI apps', (self.output / 'news' / 'index.html').read_text())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PageCacheTestCase(TestCase):
+    def setUp(self):
+        page_cache().clear()
+
+    def csrf_token(self, response):
+        return re.search(rb'name="csrfmiddlewaretoken" value="([^"]+)"', response.content).group(1).decode()
+
+    def test_cached_page_gets_a_working_csrf_token_per_visitor(self):
+        self.client.get('/contact/')
+        visitor = Client(enforce_csrf_checks=True)
+        response = visitor.get('/contact/')
+
+        self.assertNotIn(CSRF_PLACEHOLDER.encode(), response.content)
+        self.assertIn('csrftoken', response.cookies)
+        response = visitor.post('/contact/', {
+            'first_name': 'Thabo', 'last_name': 'Nkosi', 'email': 'thabo@example.com',
+            'message': 'Quote please', 'csrfmiddlewaretoken': self.csrf_token(response),
+        })
+        self.assertContains(response, 'Thank you Thabo!')
+
+    def test_pages_with_a_csrf_form_are_private_and_not_revalidated(self):
+        response = self.client.get('/contact/')
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+        visitor = Client(enforce_csrf_checks=True)
+        response = visitor.get(
+            '/contact/', HTTP_IF_NONE_MATCH='*', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('csrftoken', response.cookies)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_pages_with_messages_are_not_cached(self):
+        self.client.get('/contact/')
+        response = self.client.post('/contact/', {'first_name': 'Thabo'})
+        self.assertContains(response, 'Please fill in all required fields.')
+        self.assertNotContains(self.client.get('/contact/'), 'Please fill in all required fields.')
+
+    def test_repeat_visit_gets_304(self):
+        response = self.client.get('/gallery/')
+        self.assertEqual(self.client.get('/gallery/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(
+            self.client.get('/gallery/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304
+        )
+        with override_settings(DEPLOY_VERSION='next'):
+            self.assertEqual(self.client.get('/gallery/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def test_key_changes_with_deploy_version(self):
+        mtime = template_mtime('website/contact.html')
+        with override_settings(DEPLOY_VERSION='v1'):
+            self.client.get('/contact/')
+        with override_settings(DEPLOY_VERSION='v2'):
+            self.client.get('/contact/')
+        self.assertTrue(page_cache().has_key(f'page:v1-{mtime:.0f}:/contact/'))
+        self.assertTrue(page_cache().has_key(f'page:v2-{mtime:.0f}:/contact/'))
+
+    def touch(self, path, seconds):
+        """Move ``path``'s mtime forward, restoring it after the test"""
+        mtime = os.path.getmtime(path)
+        self.addCleanup(os.utime, path, (mtime, mtime))
+        os.utime(path, (mtime + seconds, mtime + seconds))
+
+    @override_settings(DEPLOY_VERSION='v1')
+    def test_template_edit_is_not_served_stale(self):
+        mtime = template_mtime('website/contact.html')
+        self.client.get('/contact/')
+        page_cache().set(f'page:v1-{mtime:.0f}:/contact/', 'stale page')
+
+        self.assertEqual(self.client.get('/contact/').content, b'stale page')
+        self.touch(get_template('website/contact.html').origin.name, 10)
+        self.assertNotEqual(self.client.get('/contact/').content, b'stale page')
+
+    def test_manifest_rebuild_is_not_served_stale(self):
+        workdir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workdir)
+        manifest = workdir / 'responsive_images.json'
+        manifest.write_text('{}')
+
+        with override_settings(RESPONSIVE_IMAGES_MANIFEST=manifest):
+            response = self.client.get('/team/')
+            page_cache().set(f'page:{template_version("website/team.html")}:/team/', 'stale page')
+            self.assertEqual(self.client.get('/team/').content, b'stale page')
+
+            self.touch(manifest, 10)
+            self.assertNotEqual(self.client.get('/team/').content, b'stale page')
+            self.assertEqual(self.client.get('/team/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+
+class CompressionTestCase(TestCase):
+    CSS = b'.news-item { display: block; }\n' * 200
+
+    def setUp(self):
+        self.static_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.static_root)
+        (self.static_root / 'site.css').write_bytes(self.CSS)
+        call_command('compress_static', str(self.static_root), stdout=StringIO())
+
+    def test_serves_precompressed_sibling(self):
+        with override_settings(STATIC_ROOT=self.static_root):
+            response = self.client.get('/static/site.css', HTTP_ACCEPT_ENCODING='gzip, deflate')
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(response['Content-Type'], 'text/css')
+            self.assertEqual(response['Vary'], 'Accept-Encoding')
+            self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), self.CSS)
+
+            response = self.client.get('/static/site.css', HTTP_ACCEPT_ENCODING='gzip;q=0')
+            self.assertNotIn('Content-Encoding', response)
+            self.assertEqual(b''.join(response.streaming_content), self.CSS)
+
+    @skipUnless(brotli, 'brotli is not installed')
+    def test_prefers_brotli(self):
+        with override_settings(STATIC_ROOT=self.static_root):
+            response = self.client.get('/static/site.css', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(b''.join(response.streaming_content)), self.CSS)
+
+    @override_settings(READ_DATABASE='default', CACHES=LOCMEM_CACHES)
+    def test_cached_pages_are_served_compressed(self):
+        news_cache().clear()
+        page_cache().clear()
+        for url in ('/news/', '/team/', '/news/'):
+            plain = self.client.get(url).content
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.decompress(response.content), plain)
+
+
+MANIFEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'website.storage.ManifestStorage'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StaticManifestTestCase(TestCase):
+    def setUp(self):
+        page_cache().clear()
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root)
+        settings = override_settings(STATIC_ROOT=static_root, STORAGES=MANIFEST_STORAGES)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    def test_hashed_assets_are_immutable(self):
+        page = self.client.get('/team/').content.decode()
+        url = re.search(r'href="(/static/website/css/styles\.[0-9a-f]{12}\.css)"', page).group(1)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+
+        response = self.client.get('/static/website/css/styles.css')
+        self.assertNotIn('Cache-Control', response)
+
+
+class OptimizeMediaTestCase(SimpleTestCase):
+    def setUp(self):
+        self.workdir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.workdir)
+        self.root = self.workdir / 'static'
+        (self.root / 'images' / 'hero').mkdir(parents=True)
+        (self.root / 'images' / 'logos').mkdir(parents=True)
+        self.manifest = self.workdir / 'static-manifest.json'
+        # Smooth images keep the AVIF and WebP variants quick to encode
+        Image.radial_gradient('L').resize((2400, 1600)).convert('RGB').save(
+            self.root / 'images' / 'hero' / 'banner1.jpg', quality=98,
+        )
+        Image.new('RGBA', (300, 100), (0, 0, 0, 0)).save(self.root / 'images' / 'logos' / 'Acme.webp')
+
+    def optimize(self, *args, root=None, stderr=None):
+        root = root or self.root
+        out = StringIO()
+        call_command(
+            'optimize_media', '--root', str(root), '--cache', str(root.parent / f'{root.name}.json'),
+            '--originals', str(root.parent / f'{root.name}-originals'),
+            '--manifest', str(root.parent / f'{root.name}-manifest.json'), *args, stdout=out, stderr=stderr,
+        )
+        return out.getvalue()
+
+    def test_files_are_optimized_once(self):
+        output = self.optimize()
+
+        self.assertIn('2 optimized', output)
+        with Image.open(self.root / 'images' / 'hero' / 'banner1.jpg') as banner:
+            self.assertEqual(banner.size, (1620, 1080))
+        with Image.open(self.root / 'images' / 'logos' / 'acme.png') as logo:
+            self.assertEqual(logo.convert('RGBA').getextrema()[3], (0, 0))
+        self.assertFalse((self.root / 'images' / 'logos' / 'Acme.webp').exists())
+        self.assertTrue((self.workdir / 'static-originals' / 'images' / 'hero' / 'banner1.jpg').is_file())
+
+        self.assertIn('0 optimized, 0 kept, 2 current', self.optimize())
+
+    def test_only_new_files_are_processed(self):
+        self.optimize()
+        Image.new('RGB', (300, 100), 'red').save(self.root / 'images' / 'logos' / 'zeta.jpg')
+
+        output = self.optimize()
+        self.assertIn('Optimized images/logos/zeta.jpg', output)
+        self.assertIn('1 optimized, 0 kept, 2 current', output)
+
+    def test_output_does_not_depend_on_worker_count(self):
+        Image.linear_gradient('L').resize((2000, 1200)).convert('RGB').save(self.root / 'images' / 'hero' / 'banner2.jpg')
+        copy = self.workdir / 'copy'
+        shutil.copytree(self.root, copy)
+
+        self.optimize('--workers', '1')
+        self.optimize('--workers', '3', root=copy)
+        for name in ('images/hero/banner1.jpg', 'images/hero/banner2.jpg', 'images/logos/acme.png'):
+            self.assertEqual((self.root / name).read_bytes(), (copy / name).read_bytes())
+
+    def test_errors_are_reported_per_file(self):
+        (self.root / 'images' / 'hero' / 'broken.jpg').write_bytes(b'not an image')
+        err = StringIO()
+
+        with self.assertRaisesMessage(CommandError, '1 file(s) could not be optimized'):
+            self.optimize('--workers', '2', stderr=err)
+        self.assertIn('Error optimizing images/hero/broken.jpg', err.getvalue())
+        with Image.open(self.root / 'images' / 'hero' / 'banner1.jpg') as banner:
+            self.assertEqual(banner.size, (1620, 1080))
+
+    def test_changed_rule_re_encodes_from_original(self):
+        self.optimize()
+        entry = json.loads((self.workdir / 'static.json').read_text())['images/hero/banner1.jpg']
+        entry['recipe'] = 'older settings'
+        (self.workdir / 'static.json').write_text(json.dumps({'images/hero/banner1.jpg': entry}))
+
+        original_kb = (self.workdir / 'static-originals' / 'images' / 'hero' / 'banner1.jpg').stat().st_size / 1024
+        self.assertIn(f'Optimized images/hero/banner1.jpg: {original_kb:.0f} KB ->', self.optimize('--rule', 'hero'))
+
+    def test_responsive_variants_are_recorded(self):
+        self.optimize()
+        variants = self.root / 'images' / 'hero' / 'variants'
+        entry = json.loads(self.manifest.read_text())['static/images/hero/banner1.jpg']
+
+        self.assertEqual((entry['width'], entry['height']), (1620, 1080))
+        self.assertEqual(
+            entry['sources']['jpeg'],
+            [[width, f'static/images/hero/variants/banner1-{width}.jpg'] for width in (640, 1024, 1440, 1620)],
+        )
+        with Image.open(variants / 'banner1-640.jpg') as variant:
+            self.assertEqual(variant.size, (640, 426))
+        self.assertNotIn('static/images/logos/acme.png', json.loads(self.manifest.read_text()))
+
+        (variants / 'banner1-640.jpg').unlink()
+        self.assertIn('1 optimized, 0 kept, 1 current', self.optimize())
+        self.assertTrue((variants / 'banner1-640.jpg').is_file())
+
+    def test_logo_background_is_keyed(self):
+        logo = Image.new('RGB', (300, 100), 'white')
+        logo.paste((200, 30, 30), (100, 25, 200, 75))
+        logo.save(self.root / 'images' / 'logos' / 'zeta.png')
+        size = (self.root / 'images' / 'logos' / 'zeta.png').stat().st_size
+
+        self.assertIn('Optimized images/logos/zeta.png', self.optimize('--rule', 'logos'))
+        with Image.open(self.root / 'images' / 'logos' / 'zeta.png') as keyed:
+            keyed = keyed.convert('RGBA')
+            self.assertEqual(keyed.getpixel((0, 0))[3], 0)
+            self.assertEqual(keyed.getpixel((150, 50)), (200, 30, 30, 255))
+        self.assertLessEqual((self.root / 'images' / 'logos' / 'zeta.png').stat().st_size, size)
+
+    def test_opaque_rgba_logo_is_keyed(self):
+        # An alpha channel with nothing transparent in it, like jasolar.png
+        logo = Image.new('RGBA', (300, 100), 'white')
+        logo.paste((20, 60, 160, 255), (100, 25, 200, 75))
+        logo.save(self.root / 'images' / 'logos' / 'opaque.png')
+
+        self.optimize('--rule', 'logos')
+        with Image.open(self.root / 'images' / 'logos' / 'opaque.png') as keyed:
+            keyed = keyed.convert('RGBA')
+            self.assertEqual(keyed.getpixel((0, 0))[3], 0)
+            self.assertEqual(keyed.getpixel((150, 50)), (20, 60, 160, 255))
+
+
+class KeyBackgroundTestCase(SimpleTestCase):
+    def grey_ramp(self):
+        """One pixel per grey level from 255 (white) down to 220"""
+        return Image.fromarray(np.repeat(np.arange(255, 219, -1, dtype=np.uint8), 3).reshape(1, -1, 3))
+
+    def test_threshold_keys_near_white(self):
+        alpha = np.asarray(key_background(self.grey_ramp(), threshold=15))[0, :, 3]
+
+        self.assertEqual(alpha[:15].tolist(), [0] * 15)
+        self.assertEqual(alpha[15:].tolist(), [255] * 21)
+
+    def test_feather_ramps_opacity(self):
+        alpha = np.asarray(key_background(self.grey_ramp(), threshold=15, feather=3))[0, :, 3]
+
+        self.assertEqual(alpha[14:20].tolist(), [0, 64, 128, 191, 255, 255])
+
+    def test_existing_transparency_is_kept(self):
+        img = self.grey_ramp().convert('RGBA')
+        img.putalpha(128)
+        alpha = np.asarray(key_background(img, threshold=15))[0, :, 3]
+
+        self.assertEqual(alpha[:15].tolist(), [0] * 15)
+        self.assertEqual(alpha[15:].tolist(), [128] * 21)
+
+
+class ResponsiveImageTagTestCase(SimpleTestCase):
+    def setUp(self):
+        workdir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, workdir)
+        manifest = workdir / 'responsive_images.json'
+        manifest.write_text(json.dumps({'website/images/hero/banner1.jpg': {
+            'width': 1620,
+            'height': 1080,
+            'sources': {
+                fmt: [[width, f'website/images/hero/variants/banner1-{width}.{ext}'] for width in (640, 1620)]
+                for fmt, ext in (('avif', 'avif'), ('webp', 'webp'), ('jpeg', 'jpg'))
+            },
+        }}))
+        settings = override_settings(RESPONSIVE_IMAGES_MANIFEST=manifest)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def render(self, source):
+        return Template('{% load responsive_images %}' + source).render(Context())
+
+    def test_picture_lists_every_variant(self):
+        html = self.render('{% responsive_image "website/images/hero/banner1.jpg" alt="Solar" sizes="50vw" loading="lazy" %}')
+
+        self.assertInHTML(
+            '<picture>'
+            '<source type="image/avif" srcset="/static/website/images/hero/variants/banner1-640.avif 640w, '
+            '/static/website/images/hero/variants/banner1-1620.avif 1620w" sizes="50vw">'
+            '<source type="image/webp" srcset="/static/website/images/hero/variants/banner1-640.webp 640w, '
+            '/static/website/images/hero/variants/banner1-1620.webp 1620w" sizes="50vw">'
+            '<img src="/static/website/images/hero/variants/banner1-1620.jpg" '
+            'srcset="/static/website/images/hero/variants/banner1-640.jpg 640w, '
+            '/static/website/images/hero/variants/banner1-1620.jpg 1620w" '
+            'sizes="50vw" width="1620" height="1080" alt="Solar" loading="lazy">'
+            '</picture>',
+            html,
+        )
+
+    def test_unlisted_image_is_a_plain_img(self):
+        html = self.render('{% responsive_image "website/images/about/about1.jpg" alt="About" class="photo" %}')
+
+        self.assertHTMLEqual(html, '<img src="/static/website/images/about/about1.jpg" alt="About" class="photo">')
+
+    def test_background_switches_variant_by_viewport_width(self):
+        css = self.render('{% responsive_background ".slide" "website/images/hero/banner1.jpg" "linear-gradient(red, blue)" %}')
+
+        first, second = css.splitlines()
+        self.assertTrue(first.startswith(".slide { background: linear-gradient(red, blue), url('/static/website/images/hero/variants/banner1-640.jpg') !important;"))
+        self.assertIn('url(\'/static/website/images/hero/variants/banner1-640.avif\') type("image/avif")', first)
+        self.assertTrue(second.startswith('@media (min-width: 641px) { .slide {'))
+        self.assertIn('banner1-1620.webp', second)
+
+
+# A mirrored 'readonly' alias would be a second connection to the in-memory
+# test database, which SQLite locks out while TestCase holds its transaction
+@override_settings(READ_DATABASE='default', CACHES=LOCMEM_CACHES)
+class NewsApiTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        start = timezone.now()
+        cls.articles = [
+            NewsArticle.objects.create(
+                title=f'Story {n}',
+                summary='Summary',
+                url=f'https://example.com/{n}',
+                source='news24' if n % 2 else 'mybroadband',
+                category='solar' if n % 3 == 0 else 'ict',
+                # Pairs of articles share a timestamp so the id tie-break matters
+                published_date=start - timedelta(hours=n // 2),
+            )
+            for n in range(12)
+        ]
+        NewsArticle.objects.create(
+            title='Hidden', summary='', url='https://example.com/hidden', source='news24',
+            category='ict', published_date=start, is_active=False,
+        )
+
+    def fetch_all(self, **params):
+        titles, cursor, pages = [], None, 0
+        while True:
+            query = dict(params, **({'cursor': cursor} if cursor else {}))
+            data = self.client.get('/api/news/', query).json()
+            titles += [row['title'] for row in data['results']]
+            pages += 1
+            cursor = data['next_cursor']
+            if not cursor:
+                return titles, pages
+
+    def test_pages_cover_every_active_article_once_in_order(self):
+        titles, pages = self.fetch_all(limit=5)
+
+        expected = sorted(self.articles, key=lambda article: (article.published_date, article.id), reverse=True)
+        self.assertEqual(titles, [article.title for article in expected])
+        self.assertEqual(pages, 3)
+
+    def test_filters(self):
+        titles, _ = self.fetch_all(category='solar', source='mybroadband', limit=1)
+        self.assertEqual(titles, ['Story 0', 'Story 6'])
+
+    def test_rejects_bad_input(self):
+        self.assertEqual(self.client.get('/api/news/', {'cursor': 'nonsense'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/news/', {'category': 'sport'}).status_code, 400)
+
+    def test_later_pages_seek_on_the_index(self):
+        published_date, pk = self.articles[5].published_date, self.articles[5].id
+        queryset = NewsArticle.objects.filter(
+            Q(published_date__lte=published_date) & (Q(published_date__lt=published_date) | Q(id__lt=pk)),
+            category='ict', is_active=True,
+        ).order_by('-published_date', '-id')[:21]
+        plan = queryset.explain()
+        self.assertIn('news_category_listing_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
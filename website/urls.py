@@ -1,10 +1,16 @@
 from django.urls import path
 from . import views
 
-urlpatterns = [
+# The HTML pages, which export_site pre-renders
+pages = [
     path('', views.index, name='home'),
     path('contact/', views.contact, name='contact'),
     path('gallery/', views.gallery, name='gallery'),
     path('news/', views.news, name='news'),
     path('team/', views.team, name='team'),
+]
+
+urlpatterns = pages + [
+    path('api/news/', views.news_api, name='news_api'),
+    path('metrics/', views.scrape_metrics, name='scrape_metrics'),
 ]
\ No newline at end of file
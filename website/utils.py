@@ -0,0 +1,12 @@
+import os
+import tempfile
+
+
+def write_atomic(path, content):
+    """Replace ``path`` in one step so a reader (e.g. a file server) never sees half a file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
@@ -1,16 +1,27 @@
+from django.conf import settings
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 from django.contrib import messages
-from .models import NewsArticle
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from .compression import compressed_variants, variant_response
+from .models import NewsArticle, ScrapeRun, SourceRunStats
+from .news_cache import news_cache, news_etag, news_last_modified, page_key
+from .page_cache import cached_page
+import base64
+import binascii
 import json
 
 
+@cached_page('website/index.html')
 def index(request):
     """Render the main homepage"""
     return render(request, 'website/index.html')
 
 
+@cached_page('website/contact.html')
 def contact(request):
     """Handle contact form submission and render contact page"""
     if request.method == 'POST':
@@ -44,21 +55,33 @@ def contact(request):
     return render(request, 'website/contact.html')
 
 
+@cached_page('website/gallery.html')
 def gallery(request):
     """Render the gallery page"""
     return render(request, 'website/gallery.html')
 
 
+@condition(etag_func=news_etag, last_modified_func=news_last_modified)
 def news(request):
-    """Render the news page with scraped articles"""
+    """Render the news page with scraped articles
+
+    The rendered page is cached until the next scrape (or article edit)
+    bumps the news generation, which is also its ETag.
+    """
+    cache = news_cache()
+    key = page_key('page')
+    variants = cache.get(key)
+    if variants is not None:
+        return variant_response(request, variants)
+    
     # Get ICT news articles
-    ict_articles = NewsArticle.objects.filter(
+    ict_articles = NewsArticle.objects.using(settings.READ_DATABASE).filter(
         category='ict', 
         is_active=True
     ).order_by('-published_date')[:10]
     
     # Get solar/power articles if any
-    solar_articles = NewsArticle.objects.filter(
+    solar_articles = NewsArticle.objects.using(settings.READ_DATABASE).filter(
         category='solar', 
         is_active=True
     ).order_by('-published_date')[:10]
@@ -68,9 +91,126 @@ def news(request):
         'solar_articles': solar_articles,
     }
     
-    return render(request, 'website/news.html', context)
+    variants = compressed_variants(render(request, 'website/news.html', context).content)
+    cache.set(key, variants, settings.NEWS_CACHE_TIMEOUT)
+    return variant_response(request, variants)
 
 
+@cached_page('website/team.html')
 def team(request):
     """Render the team page"""
     return render(request, 'website/team.html')
+
+
+NEWS_API_FIELDS = ('id', 'title', 'summary', 'url', 'source', 'category', 'published_date')
+NEWS_API_DEFAULT_LIMIT = 20
+NEWS_API_MAX_LIMIT = 50
+
+
+def _encode_cursor(published_date, pk):
+    data = json.dumps([published_date.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def _decode_cursor(cursor):
+    """Return ``(published_date, id)`` from a cursor, or raise ValueError"""
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        published, pk = json.loads(data)
+        published_date = parse_datetime(published)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError('Invalid cursor') from e
+    if published_date is None or not isinstance(pk, int):
+        raise ValueError('Invalid cursor')
+    return published_date, pk
+
+
+def news_api(request):
+    """Active articles, newest first, keyset-paginated on (published_date, id)
+
+    Query parameters: ``category``, ``source``, ``limit`` and ``cursor`` (the
+    ``next_cursor`` of the previous page). Each page is an index seek, so
+    deep pages cost the same as the first.
+    """
+    articles = NewsArticle.objects.using(settings.READ_DATABASE).filter(is_active=True)
+
+    category = request.GET.get('category')
+    if category:
+        if category not in dict(NewsArticle.CATEGORY_CHOICES):
+            return JsonResponse({'error': f'Unknown category: {category}'}, status=400)
+        articles = articles.filter(category=category)
+
+    source = request.GET.get('source')
+    if source:
+        if source not in dict(NewsArticle.SOURCE_CHOICES):
+            return JsonResponse({'error': f'Unknown source: {source}'}, status=400)
+        articles = articles.filter(source=source)
+
+    try:
+        limit = int(request.GET.get('limit', NEWS_API_DEFAULT_LIMIT))
+    except ValueError:
+        return JsonResponse({'error': 'limit must be an integer'}, status=400)
+    limit = max(1, min(limit, NEWS_API_MAX_LIMIT))
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            published_date, pk = _decode_cursor(cursor)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        # The <= bound is the index range; the OR only filters ties within it
+        articles = articles.filter(
+            Q(published_date__lte=published_date)
+            & (Q(published_date__lt=published_date) | Q(id__lt=pk))
+        )
+
+    rows = list(articles.order_by('-published_date', '-id').values(*NEWS_API_FIELDS)[:limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]['published_date'], rows[-1]['id'])
+
+    return JsonResponse({'results': rows, 'next_cursor': next_cursor})
+
+
+# (metric name, SourceRunStats field, scale, help text)
+SOURCE_METRICS = [
+    ('bjs_scrape_fetch_seconds', 'fetch_ms', 0.001, 'Listing page fetch latency'),
+    ('bjs_scrape_bytes_downloaded', 'bytes_downloaded', 1, 'Bytes downloaded for the listing page'),
+    ('bjs_scrape_parse_seconds', 'parse_ms', 0.001, 'Time spent parsing and classifying'),
+    ('bjs_scrape_db_seconds', 'db_ms', 0.001, 'Time spent on duplicate checks and inserts'),
+    ('bjs_scrape_articles_seen', 'articles_seen', 1, 'Articles found on the listing page'),
+    ('bjs_scrape_articles_new', 'articles_new', 1, 'Articles that were new'),
+    ('bjs_scrape_articles_duplicate', 'articles_duplicate', 1, 'Articles that were already stored'),
+    ('bjs_scrape_unchanged', 'unchanged', 1, 'Whether the listing page was unchanged (1) or parsed (0)'),
+    ('bjs_scrape_errors', 'errors', 1, 'Errors raised while scraping the source'),
+]
+
+
+def scrape_metrics(request):
+    """Expose the latest scrape run per source in Prometheus text format"""
+    lines = []
+    last_run = ScrapeRun.objects.first()
+    if last_run:
+        lines += [
+            '# HELP bjs_scrape_last_run_timestamp_seconds Start time of the latest scrape run',
+            '# TYPE bjs_scrape_last_run_timestamp_seconds gauge',
+            f'bjs_scrape_last_run_timestamp_seconds {last_run.started_date.timestamp():.3f}',
+            '# HELP bjs_scrape_duration_seconds Duration of the latest scrape run',
+            '# TYPE bjs_scrape_duration_seconds gauge',
+            f'bjs_scrape_duration_seconds {last_run.duration_ms / 1000:.6f}',
+        ]
+
+    # In daemon mode each run only covers the sources that were due
+    latest = []
+    for source, _ in NewsArticle.SOURCE_CHOICES:
+        stats = SourceRunStats.objects.filter(source=source).order_by('-run__started_date').first()
+        if stats:
+            latest.append(stats)
+
+    for name, field, scale, help_text in SOURCE_METRICS:
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} gauge']
+        for stats in latest:
+            lines.append(f'{name}{{source="{stats.source}"}} {float(getattr(stats, field)) * scale:g}')
+
+    return HttpResponse('\n'.join(lines) + '\n', content_type='text/plain; version=0.0.4; charset=utf-8')